@@ -0,0 +1,10 @@
+import logging
+
+# Library modules only emit records; the entrypoint decides where they go.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Send package logs to stderr. Call this from scripts that want tool logs."""
+    logging.basicConfig(level=level, format="%(name)s - %(levelname)s - %(message)s")
+    logging.getLogger(__name__).setLevel(level)
@@ -1,9 +1,17 @@
+import asyncio
 import os
-import logging
-from datetime import datetime
+import threading
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache, wraps
+from typing import Callable
 
 from google.adk.agents import LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.models.lite_llm import LiteLlm
+from google.genai import types
 
+from .agent_prompts import DATE_SUFFIX, STATIC_INSTRUCTION
 from .tools import (
     # Career & Job Search
     search_jobs,
@@ -42,70 +50,75 @@ from .tools import (
     financial_summary,
 )
 
-logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
-
 MODEL_NAME = os.getenv("MODEL_NAME", "groq/llama-3.1-8b-instant")
-current_date = datetime.now().strftime("%B %d, %Y")
+# Per-request LLM budget in seconds, so one stalled provider call can't hang a turn.
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30"))
+LLM_RETRIES = int(os.getenv("LLM_RETRIES", "1"))
+
+
+@lru_cache(maxsize=2)
+def _instruction_for_day(day_ordinal: int) -> str:
+    """Full system prompt for the given day (formatted once per day)."""
+    current_date = date.fromordinal(day_ordinal).strftime("%B %d, %Y")
+    return STATIC_INSTRUCTION + DATE_SUFFIX.substitute(date=current_date)
+
+
+def build_instruction(context: ReadonlyContext) -> str:
+    """Return the system prompt with today's date appended as a small tail.
+
+    Called by ADK on every turn, so the date stays current without
+    rebuilding (and re-caching) the static prefix.
+    """
+    return _instruction_for_day(date.today().toordinal())
+
+
+def build_model(model_name: str) -> str | LiteLlm:
+    """Resolve MODEL_NAME, routing non-Gemini models through LiteLLM with a timeout."""
+    if model_name.startswith("gemini"):
+        return model_name
+    return LiteLlm(model=model_name, timeout=LLM_TIMEOUT, num_retries=LLM_RETRIES)
+
+
+def build_generate_content_config(model_name: str) -> types.GenerateContentConfig | None:
+    """Apply LLM_TIMEOUT to native Gemini calls (LiteLLM models take it directly)."""
+    if not model_name.startswith("gemini"):
+        return None
+    return types.GenerateContentConfig(
+        http_options=types.HttpOptions(timeout=int(LLM_TIMEOUT * 1000)),
+    )
+
+
+# Tools in the same module share a data file, so they run one at a time;
+# tools from different modules may run concurrently.
+_MODULE_LOCKS: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+
+
+def run_in_thread(func: Callable) -> Callable:
+    """Expose a blocking tool as a coroutine that runs in a worker thread.
+
+    ADK awaits async tools, so independent calls made in one model turn
+    (e.g. log_mood + view_expenses) no longer block each other.
+    """
+    lock = _MODULE_LOCKS[func.__module__]
+
+    def call_locked(*args, **kwargs):
+        with lock:
+            return func(*args, **kwargs)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(call_locked, *args, **kwargs)
+
+    return wrapper
+
 
 root_agent = LlmAgent(
     name="life_pilot",
-    model=MODEL_NAME,
+    model=build_model(MODEL_NAME),
+    generate_content_config=build_generate_content_config(MODEL_NAME),
     description="Your personal AI life assistant - career, wellness, planning, and finance.",
-    instruction=f"""You are Life Pilot - a personal AI assistant that helps manage every aspect of life.
-You are warm, supportive, and proactive. You genuinely care about the user's wellbeing and growth.
-
-IMPORTANT: Today's date is {current_date}. Use this for any date or time calculations.
-
-You have powerful tools across 4 areas. Use them PROACTIVELY whenever relevant:
-
-**1. CAREER & JOB SEARCH**
-- search_jobs(job_title, location): Search across 6 job boards
-- get_dsa_roadmap(weeks): DSA study plan (1-16 weeks)
-- get_resume_tips(): Categorized resume advice
-- get_portfolio_ideas(tech): Tech-specific project ideas
-- get_interview_questions(role, tech): Interview prep with STAR method
-- analyze_skill_gap(current_skills, target_role): Skills vs role requirements
-- add_application(company, role, status, notes): Track job applications
-- update_application(application_id, status, notes): Update application status
-- list_applications(status_filter): View tracked applications
-
-**2. WELLNESS & MENTAL HEALTH**
-- log_mood(mood, notes): Track mood (great/good/okay/low/stressed/anxious/sad/angry/tired)
-- get_mood_history(days): View mood trends and patterns
-- get_motivation(): Get a motivational quote and affirmation
-- get_breathing_exercise(exercise_type): Guided breathing (calm/focus/ground)
-- journal_entry(entry, get_prompt): Write journal or get writing prompts
-- weekly_checkin(): Weekly mental health summary
-
-**3. DAILY PLANNER**
-- add_task(task, priority, due_date): Add tasks with priority (high/medium/low)
-- complete_task(task_id): Mark task as done
-- list_tasks(show_completed): View current tasks
-- track_habit(habit_name, completed): Track daily habits with streaks
-- view_habits(): See all habits with stats
-- set_weekly_goal(goal, category): Set weekly goals
-- complete_goal(goal_id): Mark goal as done
-- weekly_progress_report(): Full weekly progress summary
-
-**4. FINANCE**
-- add_expense(amount, category, description): Log expenses
-- view_expenses(period): Expense breakdown (today/week/month/all)
-- add_income(amount, source, description): Log income
-- set_budget(monthly_total, category_budgets): Set monthly budget
-- set_savings_goal(name, target_amount, deadline): Create savings goals
-- add_to_savings(goal_id, amount): Add to savings
-- view_savings(): View savings progress
-- financial_summary(period): Complete financial overview
-
-**YOUR PERSONALITY:**
-- Be warm and encouraging, not robotic
-- Celebrate small wins with the user
-- If they seem stressed or sad, gently suggest wellness tools
-- If they mention money, proactively offer to track it
-- If they mention a job or interview, jump in with relevant tools
-- Give actionable advice, never generic platitudes
-- Remember: you're their personal assistant, not just a chatbot""",
-    tools=[
+    instruction=build_instruction,
+    tools=[run_in_thread(tool) for tool in (
         # Career
         search_jobs, get_dsa_roadmap, get_resume_tips, get_portfolio_ideas,
         get_interview_questions, analyze_skill_gap,
@@ -121,5 +134,5 @@ You have powerful tools across 4 areas. Use them PROACTIVELY whenever relevant:
         add_expense, view_expenses, add_income,
         set_budget, set_savings_goal, add_to_savings, view_savings,
         financial_summary,
-    ],
+    )],
 )
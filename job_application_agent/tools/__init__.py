@@ -1,19 +1,52 @@
-from .job_search import search_jobs
-from .career_tools import get_dsa_roadmap, get_resume_tips, get_portfolio_ideas
-from .interview_prep import get_interview_questions
-from .skill_analysis import analyze_skill_gap
-from .application_tracker import add_application, update_application, list_applications
-from .wellness import (
-    log_mood, get_mood_history, get_motivation, get_breathing_exercise,
-    journal_entry, weekly_checkin,
-)
-from .daily_planner import (
-    add_task, complete_task, list_tasks,
-    track_habit, view_habits,
-    set_weekly_goal, complete_goal, weekly_progress_report,
-)
-from .finance import (
-    add_expense, view_expenses, add_income,
-    set_budget, set_savings_goal, add_to_savings, view_savings,
-    financial_summary,
-)
+import importlib
+
+# Tool name -> submodule. Submodules are imported on first attribute access
+# (PEP 562) so importing one tool group doesn't load all the others.
+_LAZY = {
+    "search_jobs": "job_search",
+    "get_dsa_roadmap": "career_tools",
+    "get_resume_tips": "career_tools",
+    "get_portfolio_ideas": "career_tools",
+    "get_interview_questions": "interview_prep",
+    "analyze_skill_gap": "skill_analysis",
+    "add_application": "application_tracker",
+    "update_application": "application_tracker",
+    "list_applications": "application_tracker",
+    "log_mood": "wellness",
+    "get_mood_history": "wellness",
+    "get_motivation": "wellness",
+    "get_breathing_exercise": "wellness",
+    "journal_entry": "wellness",
+    "weekly_checkin": "wellness",
+    "add_task": "daily_planner",
+    "complete_task": "daily_planner",
+    "list_tasks": "daily_planner",
+    "track_habit": "daily_planner",
+    "view_habits": "daily_planner",
+    "set_weekly_goal": "daily_planner",
+    "complete_goal": "daily_planner",
+    "weekly_progress_report": "daily_planner",
+    "add_expense": "finance",
+    "view_expenses": "finance",
+    "add_income": "finance",
+    "set_budget": "finance",
+    "set_savings_goal": "finance",
+    "add_to_savings": "finance",
+    "view_savings": "finance",
+    "financial_summary": "finance",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,17 +1,73 @@
-"""Application Tracker Tool - Track job applications with persistent JSON storage."""
+"""Application Tracker Tool - Track job applications with persistent JSONL storage."""
 import json
 import logging
 import os
+import sys
+from collections import Counter, defaultdict
 from datetime import datetime
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
-TRACKER_FILE = os.path.join(DATA_DIR, "applications.json")
+# Set LIFEPILOT_DATA_DIR to keep data files somewhere other than ./data.
+DATA_DIR = os.getenv("LIFEPILOT_DATA_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data"
+)
+TRACKER_FILE = os.path.join(DATA_DIR, "applications.jsonl")
+LEGACY_TRACKER_FILE = os.path.join(DATA_DIR, "applications.json")
+
+# fsync rewrites before swapping them in. Set DATA_FSYNC=0 to trade durability for speed.
+DATA_FSYNC = os.getenv("DATA_FSYNC", "1") != "0"
 
-VALID_STATUSES = [
+# Ordered for display and grouping; VALID_STATUSES is for membership checks.
+VALID_STATUSES_ORDER = (
     "applied", "screening", "interview", "technical", "offer", "rejected", "withdrawn"
-]
+)
+VALID_STATUSES = frozenset(VALID_STATUSES_ORDER)
+# Display position of each status; unknown statuses (e.g. hand-edited files) sort last.
+_STATUS_RANK = {status: rank for rank, status in enumerate(VALID_STATUSES_ORDER)}
+
+# Lower-cased spellings users (and the LLM) commonly use -> canonical status.
+_STATUS_ALIASES = {
+    **{status: status for status in VALID_STATUSES_ORDER},
+    "apply": "applied",
+    "submitted": "applied",
+    "screen": "screening",
+    "phone screen": "screening",
+    "hr screen": "screening",
+    "interviewing": "interview",
+    "onsite": "interview",
+    "on-site": "interview",
+    "tech": "technical",
+    "technical interview": "technical",
+    "coding round": "technical",
+    "offered": "offer",
+    "offer received": "offer",
+    "reject": "rejected",
+    "rejection": "rejected",
+    "withdraw": "withdrawn",
+    "withdrew": "withdrawn",
+}
+
+# Parsed tracker state, reused until the file's (mtime_ns, size) changes.
+# "by_id" maps application id -> merged record, in file order; "patches"
+# counts update lines in the file that compaction hasn't folded in yet.
+_CACHE: dict = {"key": None, "by_id": None, "patches": 0}
+
+# Rendered list_applications() output per status filter, for one file state.
+_LISTINGS: dict = {"key": None, "outputs": {}}
 
 
 def _ensure_data_dir() -> None:
@@ -19,24 +75,163 @@ def _ensure_data_dir() -> None:
     os.makedirs(DATA_DIR, exist_ok=True)
 
 
-def _load_applications() -> list[dict]:
-    """Load applications from the JSON file."""
-    _ensure_data_dir()
-    if not os.path.exists(TRACKER_FILE):
-        return []
+def _file_key() -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of the tracker file, or None if it doesn't exist."""
+    try:
+        st = os.stat(TRACKER_FILE)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_matches(key: tuple[int, int] | None) -> bool:
+    return key is not None and key == _CACHE["key"] and _CACHE["by_id"] is not None
+
+
+def _update_cache(by_id: dict[int, dict] | None, patches: int = 0) -> None:
+    """Record the current file state as holding ``by_id`` (None invalidates)."""
+    _CACHE["key"] = _file_key() if by_id is not None else None
+    _CACHE["by_id"] = by_id
+    _CACHE["patches"] = patches
+    # A rewrite can leave mtime/size unchanged within one clock tick, so
+    # rendered listings are dropped on every local write.
+    _LISTINGS["key"] = None
+
+
+def _normalize_status(status: str) -> str | None:
+    """Map a user-supplied status to its canonical value, or None if unknown."""
+    if status in VALID_STATUSES:
+        return status
+    return _STATUS_ALIASES.get(" ".join(status.lower().split()))
+
+
+def _invalid_status_error(label: str, status: str) -> str:
+    return (
+        f"Error: Invalid {label} '{status.strip().lower()}'. "
+        f"Must be one of: {', '.join(VALID_STATUSES_ORDER)}"
+    )
+
+
+def _migrate_legacy_file() -> list[dict]:
+    """Convert a pre-JSONL applications.json into the JSONL tracker file."""
     try:
-        with open(TRACKER_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(LEGACY_TRACKER_FILE, "rb") as f:
+            apps = _loads(f.read())
     except (json.JSONDecodeError, IOError):
-        logger.warning("Could not read tracker file, starting fresh.")
+        logger.warning("Could not read legacy tracker file, starting fresh.")
+        return []
+    if not isinstance(apps, list):
         return []
+    _rewrite_applications(apps)
+    os.replace(LEGACY_TRACKER_FILE, LEGACY_TRACKER_FILE + ".bak")
+    logger.info("Migrated %d applications to %s", len(apps), TRACKER_FILE)
+    return apps
+
 
+def _load_index() -> dict[int, dict]:
+    """Return the id -> application index, re-reading the file only if it changed.
 
-def _save_applications(apps: list[dict]) -> None:
-    """Save applications to the JSON file."""
+    The file holds one application per line, followed by any
+    {"op": "update", "id": ...} lines, which are merged into their record.
+    The returned dict is the cache itself; callers that change a record
+    must persist the change.
+    """
+    key = _file_key()
+    if _cache_matches(key):
+        return _CACHE["by_id"]
+
+    _ensure_data_dir()
+    if key is None:
+        _update_cache(None)
+        if os.path.exists(LEGACY_TRACKER_FILE):
+            _migrate_legacy_file()
+            return _CACHE["by_id"] or {}
+        return {}
+    by_id = {}
+    patches = 0
+    try:
+        with open(TRACKER_FILE, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = _loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping unreadable line in tracker file.")
+                    continue
+                # Few distinct values across many rows: share one str object each.
+                if "status" in record:
+                    record["status"] = sys.intern(record["status"])
+                if "applied_date" in record:
+                    record["applied_date"] = sys.intern(record["applied_date"])
+                if record.pop("op", None) == "update":
+                    patches += 1
+                    target = by_id.get(record["id"])
+                    if target is not None:
+                        target.update(record)
+                else:
+                    by_id[record["id"]] = record
+    except IOError:
+        logger.warning("Could not read tracker file, starting fresh.")
+        return {}
+    _CACHE["key"] = key
+    _CACHE["by_id"] = by_id
+    _CACHE["patches"] = patches
+    return by_id
+
+
+def _load_applications() -> list[dict]:
+    """Load all applications as a fresh list, in the order they were added."""
+    return list(_load_index().values())
+
+
+def _append_line(record: dict) -> tuple[int, int] | None:
+    """Append one JSONL line and return the file key from before the write."""
+    _ensure_data_dir()
+    previous_key = _file_key()
+    with open(TRACKER_FILE, "ab") as f:
+        f.write(_dumps(record) + b"\n")
+    return previous_key
+
+
+def _append_application(app: dict) -> None:
+    """Append a single new application to the JSONL file."""
+    previous_key = _append_line(app)
+    if previous_key is None:
+        _update_cache({app["id"]: app})
+    elif _cache_matches(previous_key):
+        by_id = _CACHE["by_id"]
+        by_id[app["id"]] = app
+        _update_cache(by_id, _CACHE["patches"])
+    else:
+        _update_cache(None)
+
+
+def _append_update(application_id: int, changes: dict) -> None:
+    """Append an update line; the caller applies the changes to the cached record after."""
+    previous_key = _append_line({"op": "update", "id": application_id, **changes})
+    if _cache_matches(previous_key):
+        _update_cache(_CACHE["by_id"], _CACHE["patches"] + 1)
+    else:
+        _update_cache(None)
+
+
+def _rewrite_applications(apps: list[dict]) -> None:
+    """Rewrite the whole JSONL file with one line per application.
+
+    Used for migration and to compact accumulated update lines. Writes to a
+    temp file and swaps it in with os.replace, so an interrupted write never
+    leaves a truncated tracker behind.
+    """
     _ensure_data_dir()
-    with open(TRACKER_FILE, "w", encoding="utf-8") as f:
-        json.dump(apps, f, indent=2, ensure_ascii=False)
+    tmp_path = TRACKER_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(_dumps(app) + b"\n" for app in apps))
+        if DATA_FSYNC:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, TRACKER_FILE)
+    _update_cache({app["id"]: app for app in apps})
 
 
 def add_application(company: str, role: str, status: str = "applied", notes: str = "") -> str:
@@ -59,25 +254,26 @@ def add_application(company: str, role: str, status: str = "applied", notes: str
 
     company = company.strip()
     role = role.strip()
-    status = status.strip().lower() if status else "applied"
     notes = notes.strip() if notes else ""
 
-    if status not in VALID_STATUSES:
-        return f"Error: Invalid status '{status}'. Must be one of: {', '.join(VALID_STATUSES)}"
+    normalized = _normalize_status(status) if status else "applied"
+    if normalized is None:
+        return _invalid_status_error("status", status)
+    status = normalized
 
-    apps = _load_applications()
+    app_count = len(_load_index())
+    timestamp = datetime.now().isoformat(sep=" ", timespec="minutes")
 
     application = {
-        "id": len(apps) + 1,
+        "id": app_count + 1,
         "company": company,
         "role": role,
         "status": status,
         "notes": notes,
-        "applied_date": datetime.now().strftime("%Y-%m-%d"),
-        "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "applied_date": timestamp[:10],
+        "last_updated": timestamp,
     }
-    apps.append(application)
-    _save_applications(apps)
+    _append_application(application)
 
     logger.info("Added application #%d: %s at %s", application["id"], role, company)
     return (
@@ -105,29 +301,37 @@ def update_application(application_id: int, status: str, notes: str = "") -> str
         return "Error: Please provide a valid application ID (positive number)."
 
     application_id = int(application_id)
-    status = status.strip().lower() if status else ""
-
-    if status not in VALID_STATUSES:
-        return f"Error: Invalid status '{status}'. Must be one of: {', '.join(VALID_STATUSES)}"
+    normalized = _normalize_status(status) if status else None
+    if normalized is None:
+        return _invalid_status_error("status", status or "")
+    status = normalized
+
+    by_id = _load_index()
+    app = by_id.get(application_id)
+    if app is None:
+        return f"Error: Application #{application_id} not found."
+
+    old_status = app["status"]
+    changes = {
+        "status": status,
+        "last_updated": datetime.now().isoformat(sep=" ", timespec="minutes"),
+    }
+    if notes:
+        changes["notes"] = notes.strip()
+    # Persist first, so a failed append leaves the cached record unchanged.
+    _append_update(application_id, changes)
+    app.update(changes)
 
-    apps = _load_applications()
-    for app in apps:
-        if app["id"] == application_id:
-            old_status = app["status"]
-            app["status"] = status
-            app["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-            if notes:
-                app["notes"] = notes.strip()
-            _save_applications(apps)
-
-            logger.info("Updated application #%d: %s -> %s", application_id, old_status, status)
-            return (
-                f"Application #{application_id} updated!\n"
-                f"  {app['company']} - {app['role']}\n"
-                f"  Status: {old_status} -> {status}"
-            )
+    # Fold update lines back into the records once they outnumber them.
+    if _CACHE["patches"] > len(by_id):
+        _rewrite_applications(list(by_id.values()))
 
-    return f"Error: Application #{application_id} not found."
+    logger.info("Updated application #%d: %s -> %s", application_id, old_status, status)
+    return (
+        f"Application #{application_id} updated!\n"
+        f"  {app['company']} - {app['role']}\n"
+        f"  Status: {old_status} -> {status}"
+    )
 
 
 def list_applications(status_filter: str = "") -> str:
@@ -141,9 +345,20 @@ def list_applications(status_filter: str = "") -> str:
         Formatted list of applications with their details.
     """
     if status_filter and status_filter.strip():
-        status_filter = status_filter.strip().lower()
-        if status_filter not in VALID_STATUSES:
-            return f"Error: Invalid filter '{status_filter}'. Must be one of: {', '.join(VALID_STATUSES)}"
+        normalized = _normalize_status(status_filter)
+        if normalized is None:
+            return _invalid_status_error("filter", status_filter)
+        status_filter = normalized
+    else:
+        status_filter = ""
+
+    file_key = _file_key()
+    if file_key is not None and file_key == _LISTINGS["key"]:
+        cached = _LISTINGS["outputs"].get(status_filter)
+        if cached is not None:
+            text, total = cached
+            logger.info("Listed %d applications", total)
+            return text
 
     apps = _load_applications()
 
@@ -155,14 +370,16 @@ def list_applications(status_filter: str = "") -> str:
         if not apps:
             return f"No applications with status '{status_filter}'."
 
+    # Group by status in a single pass
+    buckets = defaultdict(list)
+    for app in apps:
+        buckets[app["status"]].append(app)
+    counts = Counter({status: len(group) for status, group in buckets.items()})
+
     lines = [f"Job Applications ({len(apps)} total):\n"]
 
-    # Group by status
-    status_order = VALID_STATUSES
-    for status in status_order:
-        group = [a for a in apps if a["status"] == status]
-        if not group:
-            continue
+    for status in sorted(buckets, key=lambda s: _STATUS_RANK.get(s, len(_STATUS_RANK))):
+        group = buckets[status]
         lines.append(f"**{status.upper()}** ({len(group)}):")
         for app in group:
             notes_str = f" | Notes: {app['notes']}" if app.get("notes") else ""
@@ -174,9 +391,16 @@ def list_applications(status_filter: str = "") -> str:
 
     # Summary stats
     total = len(apps)
-    active = sum(1 for a in apps if a["status"] not in ("rejected", "withdrawn"))
-    offers = sum(1 for a in apps if a["status"] == "offer")
+    active = total - counts["rejected"] - counts["withdrawn"]
+    offers = counts["offer"]
     lines.append(f"Summary: {total} total | {active} active | {offers} offers")
 
+    text = "\n".join(lines)
+    if file_key is not None:
+        if _LISTINGS["key"] != file_key:
+            _LISTINGS["key"] = file_key
+            _LISTINGS["outputs"] = {}
+        _LISTINGS["outputs"][status_filter] = (text, total)
+
     logger.info("Listed %d applications", total)
-    return "\n".join(lines)
+    return text
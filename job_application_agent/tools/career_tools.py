@@ -1,10 +1,12 @@
 """Career Tools - DSA roadmaps, resume tips, and portfolio ideas."""
 import logging
+from functools import lru_cache
+from itertools import accumulate
 
 logger = logging.getLogger(__name__)
 
 # --- DSA topics pool organized by difficulty ---
-DSA_TOPICS = [
+DSA_TOPICS = (
     {"topic": "Arrays & Strings", "difficulty": "Easy", "problems": 15},
     {"topic": "Hashing & Two Pointers", "difficulty": "Easy", "problems": 10},
     {"topic": "Linked Lists", "difficulty": "Easy-Medium", "problems": 10},
@@ -20,51 +22,56 @@ DSA_TOPICS = [
     {"topic": "Sliding Window & Intervals", "difficulty": "Medium", "problems": 10},
     {"topic": "Bit Manipulation", "difficulty": "Medium", "problems": 6},
     {"topic": "Mixed Practice & Mock Interviews", "difficulty": "Mixed", "problems": 20},
-]
+)
 
 
-def get_dsa_roadmap(weeks: int = 4) -> str:
-    """Generate a structured DSA study roadmap based on available weeks.
+_TOPIC_NAMES = tuple(t["topic"] for t in DSA_TOPICS)
+# _PROBLEMS_PREFIX[i] is the number of problems in the first i topics.
+_PROBLEMS_PREFIX = (0, *accumulate(t["problems"] for t in DSA_TOPICS))
 
-    Args:
-        weeks: Number of weeks for the study plan (1-16). Default is 4.
 
-    Returns:
-        A formatted weekly DSA study plan as a string.
-    """
-    if not isinstance(weeks, (int, float)):
-        return "Error: 'weeks' must be a number between 1 and 16."
-
-    weeks = max(1, min(int(weeks), 16))
-    topics = DSA_TOPICS[:]
-    total_topics = len(topics)
+@lru_cache(maxsize=16)
+def _build_dsa_roadmap(weeks: int) -> str:
+    """Format the roadmap for a clamped week count (1-16); cached per count."""
+    total_topics = len(DSA_TOPICS)
 
-    # Distribute topics across weeks
-    topics_per_week = max(1, total_topics // weeks)
+    # Distribute topics evenly: the first (total % weeks) weeks get one extra
+    base, extra = divmod(total_topics, weeks)
     plan_lines = []
+    start = 0
 
-    for week_num in range(1, weeks + 1):
-        start = (week_num - 1) * topics_per_week
-        end = start + topics_per_week if week_num < weeks else total_topics
-        week_topics = topics[start:end]
-
-        if not week_topics:
-            break
-
-        topic_names = ", ".join(t["topic"] for t in week_topics)
-        total_problems = sum(t["problems"] for t in week_topics)
+    for week_num in range(1, min(weeks, total_topics) + 1):
+        end = start + base + (1 if week_num <= extra else 0)
+        topic_names = ", ".join(_TOPIC_NAMES[start:end])
+        total_problems = _PROBLEMS_PREFIX[end] - _PROBLEMS_PREFIX[start]
         plan_lines.append(
             f"Week {week_num}: {topic_names} (~{total_problems} problems)"
         )
+        start = end
 
     tip = (
         "Tip: Focus on understanding patterns, not memorizing solutions. "
         "Practice on LeetCode, Codeforces, or GeeksforGeeks."
     )
     plan_lines.append(f"\n{tip}")
+    return "\n".join(plan_lines)
+
 
+def get_dsa_roadmap(weeks: int = 4) -> str:
+    """Generate a structured DSA study roadmap based on available weeks.
+
+    Args:
+        weeks: Number of weeks for the study plan (1-16). Default is 4.
+
+    Returns:
+        A formatted weekly DSA study plan as a string.
+    """
+    if not isinstance(weeks, (int, float)):
+        return "Error: 'weeks' must be a number between 1 and 16."
+
+    weeks = max(1, min(int(weeks), 16))
     logger.info("Generated %d-week DSA roadmap", weeks)
-    return "\n".join(plan_lines)
+    return _build_dsa_roadmap(weeks)
 
 
 # --- Resume tips organized by category ---
@@ -91,21 +98,28 @@ RESUME_TIPS = {
 }
 
 
-def get_resume_tips() -> str:
-    """Get comprehensive, categorized resume tips for tech professionals.
-
-    Returns:
-        Formatted resume tips organized by category.
-    """
+def _format_resume_tips() -> str:
     lines = []
     for category, tips in RESUME_TIPS.items():
         header = category.replace("_", " ").title()
         lines.append(f"\n**{header}:**")
         for i, tip in enumerate(tips, 1):
             lines.append(f"  {i}. {tip}")
+    return "\n".join(lines)
+
 
+# Output never changes, so it is formatted once at import.
+_RESUME_TIPS_TEXT = _format_resume_tips()
+
+
+def get_resume_tips() -> str:
+    """Get comprehensive, categorized resume tips for tech professionals.
+
+    Returns:
+        Formatted resume tips organized by category.
+    """
     logger.info("Returned resume tips")
-    return "\n".join(lines)
+    return _RESUME_TIPS_TEXT
 
 
 # --- Portfolio ideas by tech stack ---
@@ -141,6 +155,19 @@ PORTFOLIO_IDEAS = {
 }
 
 
+def _format_portfolio_ideas(ideas: list[str]) -> str:
+    lines = [f"  {i}. {idea}" for i, idea in enumerate(ideas, 1)]
+    lines.append(
+        "\nTip: Pick ONE project, build it end-to-end, deploy it, "
+        "and write about what you learned. Quality > quantity."
+    )
+    return "\n".join(lines)
+
+
+# Formatted idea list per stack; only the header depends on the caller's input.
+_PORTFOLIO_TEXT = {key: _format_portfolio_ideas(ideas) for key, ideas in PORTFOLIO_IDEAS.items()}
+
+
 def get_portfolio_ideas(tech: str = "Python") -> str:
     """Get portfolio project ideas tailored to a specific technology stack.
 
@@ -155,16 +182,7 @@ def get_portfolio_ideas(tech: str = "Python") -> str:
 
     tech = tech.strip()
     key = tech.lower()
-    ideas = PORTFOLIO_IDEAS.get(key, PORTFOLIO_IDEAS["default"])
-
-    lines = [f"Portfolio project ideas for {tech}:\n"]
-    for i, idea in enumerate(ideas, 1):
-        lines.append(f"  {i}. {idea}")
-
-    lines.append(
-        f"\nTip: Pick ONE project, build it end-to-end, deploy it, "
-        f"and write about what you learned. Quality > quantity."
-    )
+    body = _PORTFOLIO_TEXT.get(key, _PORTFOLIO_TEXT["default"])
 
     logger.info("Generated portfolio ideas for '%s'", tech)
-    return "\n".join(lines)
+    return f"Portfolio project ideas for {tech}:\n\n{body}"
@@ -2,37 +2,230 @@
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+import sys
+from bisect import bisect_left
+from collections import Counter
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
-TODOS_FILE = os.path.join(DATA_DIR, "todos.json")
+# Set LIFEPILOT_DATA_DIR to keep data files somewhere other than ./data.
+DATA_DIR = os.getenv("LIFEPILOT_DATA_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data"
+)
+TODOS_FILE = os.path.join(DATA_DIR, "todos.jsonl")
+LEGACY_TODOS_FILE = os.path.join(DATA_DIR, "todos.json")
 HABITS_FILE = os.path.join(DATA_DIR, "habits.json")
 GOALS_FILE = os.path.join(DATA_DIR, "goals.json")
 
 TODO_PRIORITIES = ["high", "medium", "low"]
 
+# Record fields with a handful of distinct values, interned on load so many
+# rows share one str object each.
+_INTERNED_FIELDS = ("status", "priority", "category", "week_start")
+
+# Checkbox shown for each task status in list_tasks.
+_STATUS_MARK = {"pending": "[ ]", "completed": "[x]"}
+
+# fsync whole-file writes before swapping them in. Set DATA_FSYNC=0 to trade durability for speed.
+DATA_FSYNC = os.getenv("DATA_FSYNC", "1") != "0"
+
+# Parsed file contents by path, reused until the file's (mtime_ns, size) changes.
+# "index" is an id -> record map for id-keyed files, built on first lookup;
+# "patches" counts journal event lines not yet folded in by compaction.
+_CACHE: dict[str, dict] = {}
+
+# Rendered weekly report body (everything below the header) for one week and
+# one state of the three planner files, so repeated reports skip the scan.
+_WEEKLY: dict = {"key": None, "body": ""}
+
 
 def _ensure_data_dir() -> None:
     os.makedirs(DATA_DIR, exist_ok=True)
 
 
-def _load_json(filepath: str) -> list:
+def _file_key(filepath: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _parse_journal(raw: bytes) -> tuple[list, int]:
+    """Fold a JSONL journal into its records.
+
+    Each line is either a record or a {"op": "complete", "id": ...} event,
+    which marks that record completed. Returns (records, event count).
+    """
+    by_id = {}
+    patches = 0
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = _loads(line)
+        except json.JSONDecodeError:
+            logger.warning("Skipping unreadable line in journal file.")
+            continue
+        if record.pop("op", None) == "complete":
+            patches += 1
+            target = by_id.get(record["id"])
+            if target is not None:
+                target.update(record, status="completed")
+        else:
+            by_id[record["id"]] = record
+    return list(by_id.values()), patches
+
+
+def _intern_fields(records: list) -> None:
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        for field in _INTERNED_FIELDS:
+            value = record.get(field)
+            if type(value) is str:
+                record[field] = sys.intern(value)
+
+
+def _cache_entry(filepath: str) -> dict | None:
+    """Return the up-to-date cache entry for a file, parsing it if needed."""
     _ensure_data_dir()
-    if not os.path.exists(filepath):
-        return []
+    key = _file_key(filepath)
+    if key is None:
+        _CACHE.pop(filepath, None)
+        if filepath == TODOS_FILE and os.path.exists(LEGACY_TODOS_FILE):
+            return _migrate_legacy_todos()
+        return None
+    entry = _CACHE.get(filepath)
+    if entry is not None and entry["key"] == key:
+        return entry
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(filepath, "rb") as f:
+            raw = f.read()
+        if filepath.endswith(".jsonl"):
+            data, patches = _parse_journal(raw)
+        else:
+            data, patches = _loads(raw), 0
     except (json.JSONDecodeError, IOError):
-        return []
+        return None
+    if isinstance(data, list):
+        _intern_fields(data)
+        if filepath == HABITS_FILE:
+            for habit in data:
+                _habit_to_columns(habit)
+    entry = _CACHE[filepath] = {"key": key, "data": data, "index": None, "patches": patches}
+    return entry
+
+
+def _load_json(filepath: str) -> list:
+    """Load a JSON list, reusing the cached parse while the file is unchanged.
+
+    Returns a fresh list, but the records are shared with the cache: callers
+    that change a record must save it.
+    """
+    entry = _cache_entry(filepath)
+    return list(entry["data"]) if entry is not None else []
+
+
+def _load_index(filepath: str) -> dict[int, dict]:
+    """Return an id -> record map for a file of id-keyed records (todos, goals)."""
+    entry = _cache_entry(filepath)
+    if entry is None:
+        return {}
+    if entry["index"] is None:
+        entry["index"] = {record["id"]: record for record in entry["data"]}
+    return entry["index"]
+
+
+def _next_id(filepath: str) -> int:
+    index = _load_index(filepath)
+    return max(index) + 1 if index else 1
+
+
+def _write_atomic(filepath: str, payload: bytes) -> None:
+    """Replace a file's contents in one step.
+
+    Writes to a temp file and swaps it in with os.replace, so readers (and an
+    interrupted write) never see a truncated file.
+    """
+    _ensure_data_dir()
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        if DATA_FSYNC:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+    # A rewrite can leave mtime/size unchanged within one clock tick.
+    _WEEKLY["key"] = None
 
 
 def _save_json(filepath: str, data: list) -> None:
+    _write_atomic(filepath, _dumps(data))
+    _CACHE[filepath] = {"key": _file_key(filepath), "data": list(data), "index": None, "patches": 0}
+
+
+def _append_journal(filepath: str, line: dict, record: dict | None = None) -> None:
+    """Append one line to a JSONL journal, keeping its cache entry current.
+
+    Pass ``record`` when the line adds a new record; otherwise the line is an
+    event, and the caller applies it to the cached record once this returns.
+    """
     _ensure_data_dir()
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    previous_key = _file_key(filepath)
+    with open(filepath, "ab") as f:
+        f.write(_dumps(line) + b"\n")
+    _WEEKLY["key"] = None
+    entry = _CACHE.get(filepath)
+    if previous_key is None:
+        _CACHE[filepath] = {"key": _file_key(filepath), "data": [record], "index": None, "patches": 0}
+    elif entry is not None and entry["key"] == previous_key:
+        entry["key"] = _file_key(filepath)
+        if record is None:
+            entry["patches"] += 1
+        else:
+            entry["data"].append(record)
+            if entry["index"] is not None:
+                entry["index"][record["id"]] = record
+    else:
+        _CACHE.pop(filepath, None)
+
+
+def _rewrite_journal(filepath: str, records: list) -> None:
+    """Rewrite a JSONL journal with one line per record and no events."""
+    _write_atomic(filepath, b"".join(_dumps(record) + b"\n" for record in records))
+    _CACHE[filepath] = {"key": _file_key(filepath), "data": list(records), "index": None, "patches": 0}
+
+
+def _migrate_legacy_todos() -> dict | None:
+    """Convert a pre-JSONL todos.json into the todos journal."""
+    try:
+        with open(LEGACY_TODOS_FILE, "rb") as f:
+            todos = _loads(f.read())
+    except (json.JSONDecodeError, IOError):
+        logger.warning("Could not read legacy todos file, starting fresh.")
+        return None
+    if not isinstance(todos, list):
+        return None
+    _rewrite_journal(TODOS_FILE, todos)
+    os.replace(LEGACY_TODOS_FILE, LEGACY_TODOS_FILE + ".bak")
+    logger.info("Migrated %d tasks to %s", len(todos), TODOS_FILE)
+    return _CACHE[TODOS_FILE]
 
 
 # ── Todo Management ──────────────────────────────────────────
@@ -57,18 +250,16 @@ def add_task(task: str, priority: str = "medium", due_date: str = "") -> str:
     if priority not in TODO_PRIORITIES:
         return f"Error: Priority must be one of: {', '.join(TODO_PRIORITIES)}"
 
-    todos = _load_json(TODOS_FILE)
     todo = {
-        "id": len(todos) + 1,
+        "id": _next_id(TODOS_FILE),
         "task": task,
         "priority": priority,
         "status": "pending",
         "due_date": due_date.strip() if due_date else "",
-        "created": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "created": datetime.now().isoformat(sep=" ", timespec="minutes"),
         "completed_at": "",
     }
-    todos.append(todo)
-    _save_json(TODOS_FILE, todos)
+    _append_journal(TODOS_FILE, todo, record=todo)
 
     due_str = f" | Due: {todo['due_date']}" if todo["due_date"] else ""
     return (
@@ -90,24 +281,31 @@ def complete_task(task_id: int) -> str:
         return "Error: Please provide a valid task ID."
 
     task_id = int(task_id)
-    todos = _load_json(TODOS_FILE)
-
-    for todo in todos:
-        if todo["id"] == task_id:
-            if todo["status"] == "completed":
-                return f"Task #{task_id} is already completed!"
-            todo["status"] = "completed"
-            todo["completed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-            _save_json(TODOS_FILE, todos)
+    todo = _load_index(TODOS_FILE).get(task_id)
+    if todo is None:
+        return f"Error: Task #{task_id} not found."
+    if todo["status"] == "completed":
+        return f"Task #{task_id} is already completed!"
+
+    completed_at = datetime.now().isoformat(sep=" ", timespec="minutes")
+    # Persist first, so a failed append leaves the cached task unchanged.
+    _append_journal(TODOS_FILE, {"op": "complete", "id": task_id, "completed_at": completed_at})
+    todo["status"] = "completed"
+    todo["completed_at"] = completed_at
 
-            pending = sum(1 for t in todos if t["status"] == "pending")
-            completed = sum(1 for t in todos if t["status"] == "completed")
-            return (
-                f"Task #{task_id} completed: {todo['task']}\n"
-                f"Progress: {completed} done, {pending} remaining. Keep going!"
-            )
-
-    return f"Error: Task #{task_id} not found."
+    todos = _load_json(TODOS_FILE)
+    # Each task completes at most once, so events can never outnumber tasks;
+    # fold them back in once they cover more than half of them.
+    entry = _CACHE.get(TODOS_FILE)
+    if entry is not None and 2 * entry["patches"] > len(todos):
+        _rewrite_journal(TODOS_FILE, todos)
+
+    counts = Counter(t["status"] for t in todos)
+    pending, completed = counts["pending"], counts["completed"]
+    return (
+        f"Task #{task_id} completed: {todo['task']}\n"
+        f"Progress: {completed} done, {pending} remaining. Keep going!"
+    )
 
 
 def list_tasks(show_completed: bool = False) -> str:
@@ -123,29 +321,38 @@ def list_tasks(show_completed: bool = False) -> str:
     if not todos:
         return "No tasks yet! Use add_task() to get started."
 
-    if not show_completed:
-        todos = [t for t in todos if t["status"] == "pending"]
-        if not todos:
-            return "All tasks completed! You're crushing it! Add more with add_task()."
-
-    lines = [f"Your Tasks ({len(todos)}):\n"]
+    # One pass buckets the visible tasks by priority and counts progress.
+    groups = {priority: [] for priority in TODO_PRIORITIES}
+    shown = pending = completed = 0
+    for t in todos:
+        status = t["status"]
+        if status == "pending":
+            pending += 1
+        elif status == "completed":
+            completed += 1
+        if show_completed or status == "pending":
+            shown += 1
+            group = groups.get(t["priority"])
+            if group is not None:
+                group.append(t)
+    if not shown:
+        return "All tasks completed! You're crushing it! Add more with add_task()."
+
+    lines = [f"Your Tasks ({shown}):\n"]
 
     for priority in TODO_PRIORITIES:
-        group = [t for t in todos if t["priority"] == priority]
+        group = groups[priority]
         if not group:
             continue
 
-        icon = {"high": "!!!", "medium": " ! ", "low": "   "}[priority]
         lines.append(f"**{priority.upper()} PRIORITY:**")
         for t in group:
-            status = "[x]" if t["status"] == "completed" else "[ ]"
+            status = _STATUS_MARK.get(t["status"], "[ ]")
             due = f" (due: {t['due_date']})" if t.get("due_date") else ""
             lines.append(f"  {status} #{t['id']} {t['task']}{due}")
         lines.append("")
 
-    pending = sum(1 for t in todos if t["status"] == "pending")
-    completed = sum(1 for t in todos if t["status"] == "completed")
-    if completed > 0:
+    if show_completed and completed > 0:
         lines.append(f"Progress: {completed}/{completed + pending} tasks done")
 
     return "\n".join(lines)
@@ -154,6 +361,58 @@ def list_tasks(show_completed: bool = False) -> str:
 # ── Habit Tracking ───────────────────────────────────────────
 
 
+_goal_week = itemgetter("week_start")
+
+
+def _created_day(todo: dict) -> str:
+    return todo["created"][:10]
+
+
+def _habit_to_columns(habit: dict) -> None:
+    """Convert a habit's legacy list of {"date", "completed"} entries in place.
+
+    Habits store parallel, date-sorted "dates" and "completed" lists; the
+    converted form is written back the next time habits are saved.
+    """
+    entries = habit.pop("entries", None)
+    if entries is None:
+        return
+    entries = sorted(entries, key=itemgetter("date"))
+    habit["dates"] = [e["date"] for e in entries]
+    habit["completed"] = [e["completed"] for e in entries]
+
+
+def _week_stats(habit: dict, week_start: str) -> tuple[str, int, int]:
+    """Return (name, days done, days logged) for a habit since week_start."""
+    start = bisect_left(habit["dates"], week_start)
+    return habit["name"], sum(habit["completed"][start:]), len(habit["dates"]) - start
+
+
+def _compute_streak(dates: list, completed: list, today: str) -> int:
+    """Count consecutive completed days ending on ``today`` (YYYY-MM-DD).
+
+    Walks the date-sorted columns back from the newest day.
+    """
+    streak = 0
+    expected = date.fromisoformat(today).toordinal()
+    for day, done in zip(reversed(dates), reversed(completed)):
+        if not done or date.fromisoformat(day).toordinal() != expected:
+            break
+        streak += 1
+        expected -= 1
+    return streak
+
+
+def _current_streak(habit: dict, today: str) -> int:
+    """Streak as of today, using the value cached by track_habit when possible."""
+    if habit.get("last_update_date") == today:
+        return habit["streak"]
+    if "streak" in habit:
+        # Not logged today, so any earlier streak has lapsed.
+        return 0
+    return _compute_streak(habit["dates"], habit["completed"], today)
+
+
 def track_habit(habit_name: str, completed: bool = True) -> str:
     """Track a daily habit completion.
 
@@ -168,7 +427,7 @@ def track_habit(habit_name: str, completed: bool = True) -> str:
         return "Error: Habit name is required."
 
     habit_name = habit_name.strip().lower()
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = date.today().isoformat()
 
     habits = _load_json(HABITS_FILE)
 
@@ -180,32 +439,27 @@ def track_habit(habit_name: str, completed: bool = True) -> str:
             break
 
     if habit is None:
-        habit = {"name": habit_name, "entries": [], "created": today}
+        habit = {"name": habit_name, "dates": [], "completed": [], "created": today}
         habits.append(habit)
 
-    # Check if already logged today
-    today_entry = next((e for e in habit["entries"] if e["date"] == today), None)
-    if today_entry:
-        today_entry["completed"] = completed
+    # Dates stay sorted; today's entry is normally the last one.
+    dates, done = habit["dates"], habit["completed"]
+    i = bisect_left(dates, today)
+    if i < len(dates) and dates[i] == today:
+        done[i] = completed
     else:
-        habit["entries"].append({"date": today, "completed": completed})
+        dates.insert(i, today)
+        done.insert(i, completed)
 
-    _save_json(HABITS_FILE, habits)
+    # Only recomputed here; view_habits reads the cached value.
+    streak = _compute_streak(dates, done, today)
+    habit["streak"] = streak
+    habit["last_update_date"] = today
 
-    # Calculate streak
-    streak = 0
-    entries_by_date = {e["date"]: e["completed"] for e in habit["entries"]}
-    check_date = datetime.now()
-    while True:
-        date_str = check_date.strftime("%Y-%m-%d")
-        if entries_by_date.get(date_str):
-            streak += 1
-            check_date -= timedelta(days=1)
-        else:
-            break
+    _save_json(HABITS_FILE, habits)
 
-    total_done = sum(1 for e in habit["entries"] if e["completed"])
-    total_days = len(habit["entries"])
+    total_done = sum(done)
+    total_days = len(dates)
     rate = round((total_done / total_days) * 100) if total_days > 0 else 0
 
     status = "Done" if completed else "Skipped"
@@ -227,30 +481,18 @@ def view_habits() -> str:
     if not habits:
         return "No habits tracked yet! Use track_habit('exercise') to start."
 
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = date.today().isoformat()
     lines = [f"Your Habits ({len(habits)} tracked):\n"]
 
     for habit in habits:
         name = habit["name"]
-        entries = habit["entries"]
-        total_done = sum(1 for e in entries if e["completed"])
-        total = len(entries)
+        total_done = sum(habit["completed"])
+        total = len(habit["dates"])
         rate = round((total_done / total) * 100) if total > 0 else 0
 
-        # Streak
-        streak = 0
-        entries_by_date = {e["date"]: e["completed"] for e in entries}
-        check_date = datetime.now()
-        while True:
-            date_str = check_date.strftime("%Y-%m-%d")
-            if entries_by_date.get(date_str):
-                streak += 1
-                check_date -= timedelta(days=1)
-            else:
-                break
-
-        done_today = entries_by_date.get(today, False)
-        today_icon = "[x]" if done_today else "[ ]"
+        streak = _current_streak(habit, today)
+        # The streak counts back from today, so it is non-zero iff done today.
+        today_icon = "[x]" if streak else "[ ]"
 
         lines.append(
             f"  {today_icon} {name}: {streak} day streak | "
@@ -283,19 +525,20 @@ def set_weekly_goal(goal: str, category: str = "general") -> str:
     if category not in valid_categories:
         category = "general"
 
+    goal_id = _next_id(GOALS_FILE)
     goals = _load_json(GOALS_FILE)
 
     # Get current week
     now = datetime.now()
-    week_start = (now - timedelta(days=now.weekday())).strftime("%Y-%m-%d")
+    week_start = (now.date() - timedelta(days=now.weekday())).isoformat()
 
     goal_entry = {
-        "id": len(goals) + 1,
+        "id": goal_id,
         "goal": goal,
         "category": category,
         "status": "in_progress",
         "week_start": week_start,
-        "created": now.strftime("%Y-%m-%d %H:%M"),
+        "created": now.isoformat(sep=" ", timespec="minutes"),
         "completed_at": "",
     }
     goals.append(goal_entry)
@@ -322,49 +565,36 @@ def complete_goal(goal_id: int) -> str:
         return "Error: Please provide a valid goal ID."
 
     goal_id = int(goal_id)
-    goals = _load_json(GOALS_FILE)
-
-    for g in goals:
-        if g["id"] == goal_id:
-            g["status"] = "completed"
-            g["completed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-            _save_json(GOALS_FILE, goals)
-            return f"Goal #{goal_id} completed: {g['goal']}\nAmazing work! Celebrate this win!"
+    g = _load_index(GOALS_FILE).get(goal_id)
+    if g is None:
+        return f"Error: Goal #{goal_id} not found."
 
-    return f"Error: Goal #{goal_id} not found."
-
-
-def weekly_progress_report() -> str:
-    """Get a comprehensive weekly progress report covering tasks, habits, and goals.
-
-    Returns:
-        Detailed progress report with stats and recommendations.
-    """
-    now = datetime.now()
-    week_start = (now - timedelta(days=now.weekday())).strftime("%Y-%m-%d")
+    # Save an updated copy; the cache only picks it up once the write succeeds.
+    done = {**g, "status": "completed",
+            "completed_at": datetime.now().isoformat(sep=" ", timespec="minutes")}
+    _save_json(GOALS_FILE, [done if goal is g else goal for goal in _load_json(GOALS_FILE)])
+    return f"Goal #{goal_id} completed: {done['goal']}\nAmazing work! Celebrate this win!"
 
-    # Tasks
-    todos = _load_json(TODOS_FILE)
-    week_todos = [t for t in todos if t["created"][:10] >= week_start]
-    completed_todos = [t for t in week_todos if t["status"] == "completed"]
 
-    # Habits
-    habits = _load_json(HABITS_FILE)
+def _render_weekly_body(week_start: str) -> str:
+    """Render the task, habit, goal and score sections for one week."""
+    todos, habits, goals = _load_json(TODOS_FILE), _load_json(HABITS_FILE), _load_json(GOALS_FILE)
 
-    # Goals
-    goals = _load_json(GOALS_FILE)
-    week_goals = [g for g in goals if g["week_start"] == week_start]
-    completed_goals = [g for g in week_goals if g["status"] == "completed"]
+    # Tasks, goals and habit dates are all kept in date order, so this
+    # week's records are a suffix of each list.
+    todos = todos[bisect_left(todos, week_start, key=_created_day):]
+    week_todos = len(todos)
+    completed_todos = sum(1 for t in todos if t["status"] == "completed")
 
-    lines = ["**Weekly Progress Report**\n"]
-    lines.append(f"Week of {week_start} | Generated: {now.strftime('%Y-%m-%d %H:%M')}\n")
+    week_goals = goals[bisect_left(goals, week_start, key=_goal_week):]
+    completed_goals = sum(1 for g in week_goals if g["status"] == "completed")
 
     # Tasks section
-    lines.append(f"**Tasks:**")
+    lines = ["**Tasks:**"]
     if week_todos:
-        lines.append(f"  Total: {len(week_todos)} | Completed: {len(completed_todos)} | "
-                     f"Pending: {len(week_todos) - len(completed_todos)}")
-        rate = round((len(completed_todos) / len(week_todos)) * 100)
+        lines.append(f"  Total: {week_todos} | Completed: {completed_todos} | "
+                     f"Pending: {week_todos - completed_todos}")
+        rate = round((completed_todos / week_todos) * 100)
         lines.append(f"  Completion rate: {rate}%")
     else:
         lines.append(f"  No tasks created this week")
@@ -373,11 +603,10 @@ def weekly_progress_report() -> str:
     # Habits section
     lines.append(f"**Habits:**")
     if habits:
-        for h in habits:
-            week_entries = [e for e in h["entries"] if e["date"] >= week_start]
-            done = sum(1 for e in week_entries if e["completed"])
-            total = len(week_entries)
-            lines.append(f"  {h['name']}: {done}/{total} days this week")
+        lines.extend(
+            f"  {name}: {done}/{total} days this week"
+            for name, done, total in (_week_stats(h, week_start) for h in habits)
+        )
     else:
         lines.append(f"  No habits tracked yet")
     lines.append("")
@@ -388,7 +617,7 @@ def weekly_progress_report() -> str:
         for g in week_goals:
             status = "DONE" if g["status"] == "completed" else "IN PROGRESS"
             lines.append(f"  [{status}] {g['goal']} ({g['category']})")
-        lines.append(f"  Completed: {len(completed_goals)}/{len(week_goals)}")
+        lines.append(f"  Completed: {completed_goals}/{len(week_goals)}")
     else:
         lines.append(f"  No goals set this week. Use set_weekly_goal() to set some!")
     lines.append("")
@@ -396,9 +625,9 @@ def weekly_progress_report() -> str:
     # Overall score
     scores = []
     if week_todos:
-        scores.append(len(completed_todos) / len(week_todos))
+        scores.append(completed_todos / week_todos)
     if week_goals:
-        scores.append(len(completed_goals) / len(week_goals))
+        scores.append(completed_goals / len(week_goals))
 
     if scores:
         overall = round((sum(scores) / len(scores)) * 100)
@@ -415,3 +644,24 @@ def weekly_progress_report() -> str:
         lines.append("Start tracking tasks and goals to see your weekly score!")
 
     return "\n".join(lines)
+
+
+def weekly_progress_report() -> str:
+    """Get a comprehensive weekly progress report covering tasks, habits, and goals.
+
+    Returns:
+        Detailed progress report with stats and recommendations.
+    """
+    now = datetime.now()
+    week_start = (now.date() - timedelta(days=now.weekday())).isoformat()
+
+    key = (week_start, _file_key(TODOS_FILE), _file_key(HABITS_FILE), _file_key(GOALS_FILE))
+    if key != _WEEKLY["key"]:
+        _WEEKLY["body"] = _render_weekly_body(week_start)
+        _WEEKLY["key"] = key
+
+    return "\n".join([
+        "**Weekly Progress Report**\n",
+        f"Week of {week_start} | Generated: {now:%Y-%m-%d %H:%M}\n",
+        _WEEKLY["body"],
+    ])
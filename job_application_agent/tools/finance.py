@@ -2,11 +2,33 @@
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+import re
+import sys
+from bisect import bisect_left
+from collections.abc import Iterable
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
+# Set LIFEPILOT_DATA_DIR to keep data files somewhere other than ./data.
+DATA_DIR = os.getenv("LIFEPILOT_DATA_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data"
+)
 EXPENSES_FILE = os.path.join(DATA_DIR, "expenses.json")
 INCOME_FILE = os.path.join(DATA_DIR, "income.json")
 BUDGET_FILE = os.path.join(DATA_DIR, "budget.json")
@@ -19,39 +41,274 @@ EXPENSE_CATEGORIES = [
 
 INCOME_TYPES = ["salary", "freelance", "investment", "gift", "refund", "other"]
 
+# Record fields with few distinct values, interned on load so many rows share
+# one str object each.
+_INTERNED_FIELDS = ("category", "source", "date")
+
+# One comma-separated "category:amount" item of set_budget's category_budgets.
+_CAT_BUDGET_RE = re.compile(r"\s*([^:,]+?)\s*:\s*([^:,\s]+)\s*")
+
+# Savings progress bar for each whole percentage 0-100, and the expense
+# share bar's fill (one "#" per 5%).
+_PROGRESS_BARS = tuple("#" * (pct // 5) + "-" * ((100 - pct) // 5) for pct in range(101))
+_SHARE_FILL = "#" * 20
+
+# fsync saves before swapping them in. Set DATA_FSYNC=0 to trade durability for speed.
+DATA_FSYNC = os.getenv("DATA_FSYNC", "1") != "0"
+
+# Parsed file contents by path as (key, data), reused until the file's
+# (mtime_ns, size) key changes.
+_CACHE: dict[str, tuple[tuple[int, int], object]] = {}
+
+# Running totals for the expense and income files as (key, totals), valid for
+# the same file state as the _CACHE entry with that key. See _load_totals.
+_TOTALS: dict[str, tuple[tuple[int, int], dict]] = {}
+
+# (file key, payload) of the last save per path, so re-saving identical data
+# over an untouched file can be skipped.
+_SAVED: dict[str, tuple[tuple[int, int], bytes]] = {}
+
+# Open batch() blocks, and the paths whose saves they have deferred. A deferred
+# path's _CACHE entry holds its pending contents until the outermost block exits.
+_BATCH_DEPTH = 0
+_DIRTY: set[str] = set()
+
+# Cache key for a deferred save of a file that does not exist yet.
+_PENDING_KEY = (-1, -1)
+
+
+# Set once DATA_DIR has been created, so later calls skip the makedirs syscall.
+_DATA_DIR_READY = False
+
 
 def _ensure_data_dir() -> None:
-    os.makedirs(DATA_DIR, exist_ok=True)
+    global _DATA_DIR_READY
+    if not _DATA_DIR_READY:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        _DATA_DIR_READY = True
 
 
-def _load_json(filepath: str) -> list:
+def _open_for_write(path: str):
+    """Open path for binary writing, recreating DATA_DIR if it was removed."""
+    global _DATA_DIR_READY
     _ensure_data_dir()
-    if not os.path.exists(filepath):
-        return []
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else [data] if isinstance(data, dict) else []
-    except (json.JSONDecodeError, IOError):
-        return []
+        return open(path, "wb")
+    except FileNotFoundError:
+        _DATA_DIR_READY = False
+        _ensure_data_dir()
+        return open(path, "wb")
 
 
-def _load_json_dict(filepath: str) -> dict:
-    _ensure_data_dir()
-    if not os.path.exists(filepath):
-        return {}
+def _file_key(filepath: str) -> tuple[int, int] | None:
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _intern_fields(records: list) -> None:
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        for field in _INTERNED_FIELDS:
+            value = record.get(field)
+            if type(value) is str:
+                record[field] = sys.intern(value)
+
+
+def _load_cached(filepath: str):
+    """Return a file's parsed JSON, or None if it is missing or unreadable.
+
+    The result is shared with the cache: callers that change it must save it.
+    """
+    if filepath in _DIRTY:
+        return _CACHE[filepath][1]
+    key = _file_key(filepath)
+    if key is None:
+        _CACHE.pop(filepath, None)
+        return None
+    cached = _CACHE.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        with open(filepath, "rb") as f:
+            data = _loads(f.read())
     except (json.JSONDecodeError, IOError):
-        return {}
+        return None
+    if isinstance(data, list):
+        _intern_fields(data)
+    _CACHE[filepath] = (key, data)
+    return data
+
+
+def _load_json(filepath: str) -> list:
+    data = _load_cached(filepath)
+    return list(data) if isinstance(data, list) else [data] if isinstance(data, dict) else []
+
+
+def _load_json_dict(filepath: str) -> dict:
+    data = _load_cached(filepath)
+    return dict(data) if isinstance(data, dict) else {}
+
+
+def _load_savings() -> dict:
+    """Load savings goals as {"next_id": int, "goals": {"<id>": goal}}.
+
+    Older files hold a plain list of goals; they are converted here and
+    written back in the new layout on the next save.
+    """
+    data = _load_cached(SAVINGS_FILE)
+    if isinstance(data, list):
+        goals = {str(goal["id"]): goal for goal in data}
+    elif isinstance(data, dict) and isinstance(data.get("goals"), dict):
+        goals = dict(data["goals"])
+    else:
+        goals = {}
+    next_id = data.get("next_id") if isinstance(data, dict) else None
+    return {"next_id": next_id or max(map(int, goals), default=0) + 1, "goals": goals}
 
 
 def _save_json(filepath: str, data) -> None:
-    _ensure_data_dir()
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """Save data, or only cache it until the enclosing batch() block exits."""
+    if _BATCH_DEPTH:
+        cached = _CACHE.get(filepath)
+        _CACHE[filepath] = (cached[0] if cached is not None else _PENDING_KEY, data.copy())
+        _DIRTY.add(filepath)
+        return
+    _write_json(filepath, data)
+
+
+def _write_json(filepath: str, data) -> None:
+    """Write data atomically and cache it as the file's parsed contents (no re-read).
+
+    The payload goes to a temp file that replaces the target with os.replace,
+    so a crash mid-write never leaves a truncated file behind.
+    """
+    payload = _dumps(data)
+    key = _file_key(filepath)
+    if key is not None and _SAVED.get(filepath) == (key, payload):
+        _CACHE[filepath] = (key, data.copy())
+        return
+
+    _CACHE.pop(filepath, None)
+    tmp_path = filepath + ".tmp"
+    with _open_for_write(tmp_path) as f:
+        f.write(payload)
+        if DATA_FSYNC:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+    key = _file_key(filepath)
+    _CACHE[filepath] = (key, data.copy())
+    _SAVED[filepath] = (key, payload)
+
+
+@contextmanager
+def batch():
+    """Defer finance file writes to the end of the block.
+
+    Each file changed inside the block is written once on exit instead of on
+    every call, so bulk imports rewrite a file once rather than per record.
+    Blocks may nest; the outermost one writes. If it exits with an exception,
+    nothing deferred is written and the files are re-read on next use.
+    """
+    global _BATCH_DEPTH
+    _BATCH_DEPTH += 1
+    try:
+        yield
+    except BaseException:
+        _BATCH_DEPTH -= 1
+        if _BATCH_DEPTH == 0:
+            _discard()
+        raise
+    _BATCH_DEPTH -= 1
+    if _BATCH_DEPTH == 0:
+        _flush()
+
+
+def _flush() -> None:
+    while _DIRTY:
+        filepath = _DIRTY.pop()
+        old_key, data = _CACHE[filepath]
+        try:
+            _write_json(filepath, data)
+        except BaseException:
+            _CACHE.pop(filepath, None)
+            _TOTALS.pop(filepath, None)
+            _discard()
+            raise
+        totals = _TOTALS.get(filepath)
+        if totals is not None and totals[0] == old_key:
+            _TOTALS[filepath] = (_CACHE[filepath][0], totals[1])
+
+
+def _discard() -> None:
+    """Drop deferred saves and the cached state built on them."""
+    while _DIRTY:
+        filepath = _DIRTY.pop()
+        _CACHE.pop(filepath, None)
+        _TOTALS.pop(filepath, None)
+
+
+def _new_bucket() -> dict:
+    return {"total": 0.0, "count": 0, "groups": {}}
+
+
+def _add_to_bucket(bucket: dict, amount: float, group: str) -> None:
+    bucket["total"] = round(bucket["total"] + amount, 2)
+    bucket["count"] += 1
+    groups = bucket["groups"]
+    groups[group] = round(groups.get(group, 0) + amount, 2)
+
+
+def _bucket_of(records: Iterable[dict], group_field: str) -> dict:
+    bucket = _new_bucket()
+    for r in records:
+        _add_to_bucket(bucket, r["amount"], r[group_field])
+    return bucket
+
+
+def _add_to_totals(totals: dict, record: dict, group_field: str) -> None:
+    amount, group, day = record["amount"], record[group_field], record["date"]
+    _add_to_bucket(totals["all"], amount, group)
+    for period, label in (("day", day), ("month", day[:7])):
+        buckets = totals[period]
+        if label not in buckets:
+            buckets[label] = _new_bucket()
+        _add_to_bucket(buckets[label], amount, group)
+
+
+def _load_totals(filepath: str, group_field: str) -> dict:
+    """Return amount totals for an expense or income file.
+
+    Shape: {"all": bucket, "day": {YYYY-MM-DD: bucket}, "month": {YYYY-MM: bucket}},
+    where a bucket is {"total", "count", "groups": {category/source: amount}}.
+    Built once per file state; _append_record keeps them current on writes.
+    """
+    records = _load_json(filepath)
+    cached = _CACHE.get(filepath)
+    key = cached[0] if cached is not None else None
+    entry = _TOTALS.get(filepath)
+    if entry is not None and key is not None and entry[0] == key:
+        return entry[1]
+    totals = {"all": _new_bucket(), "day": {}, "month": {}}
+    for r in records:
+        _add_to_totals(totals, r, group_field)
+    if key is not None:
+        _TOTALS[filepath] = (key, totals)
+    return totals
+
+
+def _append_record(filepath: str, records: list, record: dict, group_field: str) -> dict:
+    """Append a record to a freshly loaded list, save it and return updated totals."""
+    totals = _load_totals(filepath, group_field)
+    records.append(record)
+    _save_json(filepath, records)
+    _add_to_totals(totals, record, group_field)
+    _TOTALS[filepath] = (_CACHE[filepath][0], totals)
+    return totals
 
 
 # ── Expense Tracking ─────────────────────────────────────────
@@ -77,7 +334,8 @@ def add_expense(amount: float, category: str, description: str = "") -> str:
         return f"Error: Invalid category. Choose from: {', '.join(EXPENSE_CATEGORIES)}"
 
     amount = round(float(amount), 2)
-    today = datetime.now().strftime("%Y-%m-%d")
+    timestamp = datetime.now().isoformat(sep=" ", timespec="minutes")
+    today = timestamp[:10]
 
     expenses = _load_json(EXPENSES_FILE)
     expense = {
@@ -86,21 +344,17 @@ def add_expense(amount: float, category: str, description: str = "") -> str:
         "category": category,
         "description": description.strip() if description else "",
         "date": today,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "timestamp": timestamp,
     }
-    expenses.append(expense)
-    _save_json(EXPENSES_FILE, expenses)
-
-    # Today's total
-    today_total = sum(e["amount"] for e in expenses if e["date"] == today)
+    totals = _append_record(EXPENSES_FILE, expenses, expense, "category")
+    today_total = totals["day"][today]["total"]
 
     # Check budget
     budget = _load_json_dict(BUDGET_FILE)
     budget_warn = ""
     if budget:
         monthly_budget = budget.get("monthly_total", 0)
-        month = datetime.now().strftime("%Y-%m")
-        month_total = sum(e["amount"] for e in expenses if e["date"].startswith(month))
+        month_total = totals["month"][today[:7]]["total"]
         if monthly_budget > 0 and month_total > monthly_budget * 0.8:
             pct = round((month_total / monthly_budget) * 100)
             budget_warn = f"\n  WARNING: You've used {pct}% of your monthly budget!"
@@ -113,6 +367,31 @@ def add_expense(amount: float, category: str, description: str = "") -> str:
     )
 
 
+def _add_expenses_bulk(rows: list[dict]) -> str:
+    """Log many expenses at once, writing the expenses file a single time.
+
+    Args:
+        rows: Expenses as dicts with the add_expense arguments: amount,
+            category and optionally description.
+
+    Returns:
+        How many expenses were logged, plus any rows that were rejected.
+    """
+    errors = []
+    with batch():
+        for n, row in enumerate(rows, 1):
+            result = add_expense(row.get("amount"), row.get("category", ""), row.get("description", ""))
+            if result.startswith("Error"):
+                errors.append(f"  Row {n}: {result}")
+    logged = len(rows) - len(errors)
+    return "\n".join([f"Logged {logged} of {len(rows)} expenses."] + errors)
+
+
+def _category_row(category: str, amount: float, total: float) -> str:
+    pct = round((amount / total) * 100)
+    return f"  {category.ljust(15)} Rs.{f'{amount:,.2f}'.rjust(10)}  {_SHARE_FILL[:pct // 5]} {pct}%"
+
+
 def view_expenses(period: str = "month") -> str:
     """View expense summary for a given period.
 
@@ -128,41 +407,39 @@ def view_expenses(period: str = "month") -> str:
 
     period = period.strip().lower() if period else "month"
     now = datetime.now()
+    today = now.date()
 
+    totals = _load_totals(EXPENSES_FILE, "category")
     if period == "today":
-        cutoff = now.strftime("%Y-%m-%d")
-        filtered = [e for e in expenses if e["date"] == cutoff]
+        bucket = totals["day"].get(today.isoformat())
         period_label = "Today"
     elif period == "week":
-        cutoff = (now - timedelta(days=now.weekday())).strftime("%Y-%m-%d")
-        filtered = [e for e in expenses if e["date"] >= cutoff]
+        cutoff = (today - timedelta(days=today.weekday())).isoformat()
+        # Expenses are appended in date order, so the week is a suffix.
+        start = bisect_left(expenses, cutoff, key=itemgetter("date"))
+        bucket = _bucket_of(expenses[start:], "category")
         period_label = "This Week"
     elif period == "month":
-        cutoff = now.strftime("%Y-%m")
-        filtered = [e for e in expenses if e["date"].startswith(cutoff)]
+        bucket = totals["month"].get(today.isoformat()[:7])
         period_label = now.strftime("%B %Y")
     else:
-        filtered = expenses
+        bucket = totals["all"]
         period_label = "All Time"
 
-    if not filtered:
+    if bucket is None or not bucket["count"]:
         return f"No expenses found for {period_label}."
 
-    total = sum(e["amount"] for e in filtered)
-
-    # By category
-    by_cat = {}
-    for e in filtered:
-        by_cat[e["category"]] = by_cat.get(e["category"], 0) + e["amount"]
+    total = bucket["total"]
+    by_cat = bucket["groups"]
 
     lines = [f"**Expenses - {period_label}**\n"]
-    lines.append(f"Total: Rs.{total:,.2f} ({len(filtered)} transactions)\n")
+    lines.append(f"Total: Rs.{total:,.2f} ({bucket['count']} transactions)\n")
 
     lines.append("**By Category:**")
-    for cat, amt in sorted(by_cat.items(), key=lambda x: -x[1]):
-        pct = round((amt / total) * 100)
-        bar = "#" * (pct // 5)
-        lines.append(f"  {cat:15s} Rs.{amt:>10,.2f}  {bar} {pct}%")
+    lines.extend(
+        _category_row(cat, amt, total)
+        for cat, amt in sorted(by_cat.items(), key=itemgetter(1), reverse=True)
+    )
 
     # Budget comparison
     budget = _load_json_dict(BUDGET_FILE)
@@ -200,6 +477,7 @@ def add_income(amount: float, source: str = "salary", description: str = "") ->
         source = "other"
 
     amount = round(float(amount), 2)
+    timestamp = datetime.now().isoformat(sep=" ", timespec="minutes")
 
     income = _load_json(INCOME_FILE)
     entry = {
@@ -207,14 +485,11 @@ def add_income(amount: float, source: str = "salary", description: str = "") ->
         "amount": amount,
         "source": source,
         "description": description.strip() if description else "",
-        "date": datetime.now().strftime("%Y-%m-%d"),
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "date": timestamp[:10],
+        "timestamp": timestamp,
     }
-    income.append(entry)
-    _save_json(INCOME_FILE, income)
-
-    month = datetime.now().strftime("%Y-%m")
-    month_income = sum(i["amount"] for i in income if i["date"].startswith(month))
+    totals = _append_record(INCOME_FILE, income, entry, "source")
+    month_income = totals["month"][entry["date"][:7]]["total"]
 
     return (
         f"Income logged!\n"
@@ -240,23 +515,27 @@ def set_budget(monthly_total: float, category_budgets: str = "") -> str:
     if not isinstance(monthly_total, (int, float)) or monthly_total <= 0:
         return "Error: Monthly budget must be a positive number."
 
+    categories = {}
+    skipped = []
+    for item in (category_budgets or "").split(","):
+        if not item.strip():
+            continue
+        match = _CAT_BUDGET_RE.fullmatch(item)
+        try:
+            amount = float(match.group(2)) if match else -1.0
+        except ValueError:
+            amount = -1.0
+        if not 0 <= amount < float("inf"):
+            skipped.append(item.strip())
+            continue
+        categories[match.group(1).lower()] = round(amount, 2)
+
     budget = {
         "monthly_total": round(float(monthly_total), 2),
-        "categories": {},
-        "set_date": datetime.now().strftime("%Y-%m-%d"),
+        "categories": categories,
+        "set_date": date.today().isoformat(),
     }
 
-    if category_budgets and category_budgets.strip():
-        for item in category_budgets.split(","):
-            item = item.strip()
-            if ":" in item:
-                cat, amt = item.split(":", 1)
-                cat = cat.strip().lower()
-                try:
-                    budget["categories"][cat] = round(float(amt.strip()), 2)
-                except ValueError:
-                    pass
-
     _save_json(BUDGET_FILE, budget)
 
     lines = [f"Monthly budget set: Rs.{budget['monthly_total']:,.2f}\n"]
@@ -264,6 +543,8 @@ def set_budget(monthly_total: float, category_budgets: str = "") -> str:
         lines.append("Category limits:")
         for cat, amt in budget["categories"].items():
             lines.append(f"  {cat.title()}: Rs.{amt:,.2f}")
+    if skipped:
+        lines.append(f"Skipped (expected category:amount): {', '.join(skipped)}")
 
     lines.append(
         "\nTip: The 50/30/20 rule - 50% needs, 30% wants, 20% savings."
@@ -291,18 +572,19 @@ def set_savings_goal(name: str, target_amount: float, deadline: str = "") -> str
         return "Error: Target amount must be a positive number."
 
     name = name.strip()
-    savings = _load_json(SAVINGS_FILE)
+    savings = _load_savings()
 
     goal = {
-        "id": len(savings) + 1,
+        "id": savings["next_id"],
         "name": name,
         "target": round(float(target_amount), 2),
         "saved": 0,
         "deadline": deadline.strip() if deadline else "",
         "deposits": [],
-        "created": datetime.now().strftime("%Y-%m-%d"),
+        "created": date.today().isoformat(),
     }
-    savings.append(goal)
+    savings["goals"][str(goal["id"])] = goal
+    savings["next_id"] = goal["id"] + 1
     _save_json(SAVINGS_FILE, savings)
 
     deadline_str = f"\n  Deadline: {goal['deadline']}" if goal["deadline"] else ""
@@ -332,32 +614,45 @@ def add_to_savings(goal_id: int, amount: float) -> str:
     goal_id = int(goal_id)
     amount = round(float(amount), 2)
 
-    savings = _load_json(SAVINGS_FILE)
-    for goal in savings:
-        if goal["id"] == goal_id:
-            goal["saved"] = round(goal["saved"] + amount, 2)
-            goal["deposits"].append({
-                "amount": amount,
-                "date": datetime.now().strftime("%Y-%m-%d"),
-            })
-            _save_json(SAVINGS_FILE, savings)
+    savings = _load_savings()
+    goal = savings["goals"].get(str(goal_id))
+    if goal is None:
+        return f"Error: Savings goal #{goal_id} not found."
 
-            remaining = max(0, goal["target"] - goal["saved"])
-            pct = min(100, round((goal["saved"] / goal["target"]) * 100))
-            bar = "#" * (pct // 5) + "-" * ((100 - pct) // 5)
+    goal["saved"] = round(goal["saved"] + amount, 2)
+    goal["deposits"].append({
+        "amount": amount,
+        "date": date.today().isoformat(),
+    })
+    _save_json(SAVINGS_FILE, savings)
+
+    remaining = max(0, goal["target"] - goal["saved"])
+    pct = min(100, round((goal["saved"] / goal["target"]) * 100))
+    bar = _PROGRESS_BARS[pct]
+
+    result = (
+        f"Added Rs.{amount:,.2f} to '{goal['name']}'!\n"
+        f"  Progress: Rs.{goal['saved']:,.2f} / Rs.{goal['target']:,.2f} ({pct}%)\n"
+        f"  [{bar}]\n"
+        f"  Remaining: Rs.{remaining:,.2f}"
+    )
 
-            result = (
-                f"Added Rs.{amount:,.2f} to '{goal['name']}'!\n"
-                f"  Progress: Rs.{goal['saved']:,.2f} / Rs.{goal['target']:,.2f} ({pct}%)\n"
-                f"  [{bar}]\n"
-                f"  Remaining: Rs.{remaining:,.2f}"
-            )
+    if pct >= 100:
+        result += "\n\n  GOAL REACHED! Congratulations!"
+    return result
 
-            if pct >= 100:
-                result += "\n\n  GOAL REACHED! Congratulations!"
-            return result
 
-    return f"Error: Savings goal #{goal_id} not found."
+def _savings_block(goal: dict) -> str:
+    """Render one goal for view_savings: name, amounts, bar and a blank line."""
+    pct = min(100, round((goal["saved"] / goal["target"]) * 100)) if goal["target"] > 0 else 0
+    bar = _PROGRESS_BARS[pct]
+    deadline = f" | Deadline: {goal['deadline']}" if goal.get("deadline") else ""
+    status = " (REACHED!)" if pct >= 100 else ""
+    return (
+        f"  #{goal['id']} {goal['name']}{status}\n"
+        f"    Rs.{goal['saved']:,.2f} / Rs.{goal['target']:,.2f} ({pct}%){deadline}\n"
+        f"    [{bar}]\n"
+    )
 
 
 def view_savings() -> str:
@@ -366,29 +661,15 @@ def view_savings() -> str:
     Returns:
         Summary of all savings goals.
     """
-    savings = _load_json(SAVINGS_FILE)
+    savings = list(_load_savings()["goals"].values())
     if not savings:
         return "No savings goals yet! Use set_savings_goal() to create one."
 
     lines = [f"**Your Savings Goals ({len(savings)}):**\n"]
+    lines.extend(map(_savings_block, savings))
 
-    total_saved = 0
-    total_target = 0
-
-    for goal in savings:
-        pct = min(100, round((goal["saved"] / goal["target"]) * 100)) if goal["target"] > 0 else 0
-        bar = "#" * (pct // 5) + "-" * ((100 - pct) // 5)
-        deadline = f" | Deadline: {goal['deadline']}" if goal.get("deadline") else ""
-        status = " (REACHED!)" if pct >= 100 else ""
-
-        lines.append(f"  #{goal['id']} {goal['name']}{status}")
-        lines.append(f"    Rs.{goal['saved']:,.2f} / Rs.{goal['target']:,.2f} ({pct}%){deadline}")
-        lines.append(f"    [{bar}]")
-        lines.append("")
-
-        total_saved += goal["saved"]
-        total_target += goal["target"]
-
+    total_saved = sum(goal["saved"] for goal in savings)
+    total_target = sum(goal["target"] for goal in savings)
     lines.append(f"**Total Saved: Rs.{total_saved:,.2f} / Rs.{total_target:,.2f}**")
     return "\n".join(lines)
 
@@ -407,45 +688,38 @@ def financial_summary(period: str = "month") -> str:
     """
     now = datetime.now()
 
+    spent_totals = _load_totals(EXPENSES_FILE, "category")
+    earned_totals = _load_totals(INCOME_FILE, "source")
     if period == "month":
-        month = now.strftime("%Y-%m")
+        month = now.date().isoformat()[:7]
         period_label = now.strftime("%B %Y")
-        date_filter = lambda d: d.startswith(month)
+        spent = spent_totals["month"].get(month) or _new_bucket()
+        earned = earned_totals["month"].get(month) or _new_bucket()
     else:
         period_label = "All Time"
-        date_filter = lambda d: True
+        spent = spent_totals["all"]
+        earned = earned_totals["all"]
 
-    expenses = _load_json(EXPENSES_FILE)
-    income = _load_json(INCOME_FILE)
-    savings = _load_json(SAVINGS_FILE)
+    savings = list(_load_savings()["goals"].values())
     budget = _load_json_dict(BUDGET_FILE)
 
-    filtered_exp = [e for e in expenses if date_filter(e["date"])]
-    filtered_inc = [i for i in income if date_filter(i["date"])]
-
-    total_expense = sum(e["amount"] for e in filtered_exp)
-    total_income = sum(i["amount"] for i in filtered_inc)
+    total_expense = spent["total"]
+    total_income = earned["total"]
     net = total_income - total_expense
 
     lines = [f"**Financial Summary - {period_label}**\n"]
 
     # Income
     lines.append(f"**Income:** Rs.{total_income:,.2f}")
-    if filtered_inc:
-        by_source = {}
-        for i in filtered_inc:
-            by_source[i["source"]] = by_source.get(i["source"], 0) + i["amount"]
-        for src, amt in sorted(by_source.items(), key=lambda x: -x[1]):
+    if earned["count"]:
+        for src, amt in sorted(earned["groups"].items(), key=itemgetter(1), reverse=True):
             lines.append(f"  {src.title()}: Rs.{amt:,.2f}")
     lines.append("")
 
     # Expenses
     lines.append(f"**Expenses:** Rs.{total_expense:,.2f}")
-    if filtered_exp:
-        by_cat = {}
-        for e in filtered_exp:
-            by_cat[e["category"]] = by_cat.get(e["category"], 0) + e["amount"]
-        for cat, amt in sorted(by_cat.items(), key=lambda x: -x[1])[:5]:
+    if spent["count"]:
+        for cat, amt in sorted(spent["groups"].items(), key=itemgetter(1), reverse=True)[:5]:
             lines.append(f"  {cat.title()}: Rs.{amt:,.2f}")
     lines.append("")
 
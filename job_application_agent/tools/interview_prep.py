@@ -1,5 +1,6 @@
 """Interview Preparation Tool - Technical and behavioral interview guidance."""
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,32 @@ STAR_METHOD = (
 )
 
 
+# Roles that also get system design questions.
+_SENIOR_RE = re.compile(r"senior|lead|staff|architect", re.IGNORECASE)
+
+
+def _format_questions(questions: list[str]) -> str:
+    return "\n".join(f"  {i}. {q}" for i, q in enumerate(questions, 1))
+
+
+# Rendered once at import; the question banks never change at runtime.
+_TECHNICAL_TEXT = {key: _format_questions(qs) for key, qs in TECHNICAL_QUESTIONS.items()}
+
+_SYSTEM_DESIGN_TEXT = "\n\n**System Design Questions:**\n" + _TECHNICAL_TEXT["system_design"]
+
+# Everything after the role-specific questions: behavioral questions, STAR and tips.
+_CLOSING_TEXT = (
+    "\n\n**Behavioral Questions:**\n"
+    f"{_format_questions(BEHAVIORAL_QUESTIONS[:5])}\n"
+    f"\n**Answering Framework:**\n{STAR_METHOD}\n"
+    "\n**General Tips:**\n"
+    "  - Research the company's tech stack and recent projects\n"
+    "  - Prepare 2-3 questions to ask YOUR interviewer\n"
+    "  - Practice coding on a whiteboard or shared editor\n"
+    "  - Think out loud during technical questions"
+)
+
+
 def get_interview_questions(role: str = "software engineer", tech: str = "python") -> str:
     """Get curated interview questions for a specific role and tech stack.
 
@@ -90,32 +117,12 @@ def get_interview_questions(role: str = "software engineer", tech: str = "python
     tech = tech.strip().lower()
     role = role.strip()
 
-    tech_qs = TECHNICAL_QUESTIONS.get(tech, TECHNICAL_QUESTIONS["default"])
-    lines = [f"Interview prep for {role} ({tech.title()}):\n"]
-
-    lines.append("**Technical Questions:**")
-    for i, q in enumerate(tech_qs, 1):
-        lines.append(f"  {i}. {q}")
-
     # Add system design for senior roles
-    if any(word in role.lower() for word in ["senior", "lead", "staff", "architect"]):
-        lines.append("\n**System Design Questions:**")
-        for i, q in enumerate(TECHNICAL_QUESTIONS["system_design"], 1):
-            lines.append(f"  {i}. {q}")
-
-    lines.append("\n**Behavioral Questions:**")
-    for i, q in enumerate(BEHAVIORAL_QUESTIONS[:5], 1):
-        lines.append(f"  {i}. {q}")
-
-    lines.append(f"\n**Answering Framework:**\n{STAR_METHOD}")
-
-    lines.append(
-        "\n**General Tips:**\n"
-        "  - Research the company's tech stack and recent projects\n"
-        "  - Prepare 2-3 questions to ask YOUR interviewer\n"
-        "  - Practice coding on a whiteboard or shared editor\n"
-        "  - Think out loud during technical questions"
-    )
+    system_design = _SYSTEM_DESIGN_TEXT if _SENIOR_RE.search(role) is not None else ""
 
     logger.info("Generated interview prep for '%s' (%s)", role, tech)
-    return "\n".join(lines)
+    return (
+        f"Interview prep for {role} ({tech.title()}):\n\n"
+        f"**Technical Questions:**\n{_TECHNICAL_TEXT.get(tech, _TECHNICAL_TEXT['default'])}"
+        f"{system_design}{_CLOSING_TEXT}"
+    )
@@ -1,12 +1,37 @@
 """Job Search Tool - Generate search URLs across multiple job boards."""
-import urllib.parse
 import logging
+from functools import lru_cache
+from urllib.parse import quote as _quote
 
 logger = logging.getLogger(__name__)
 
-SUPPORTED_PLATFORMS = [
-    "LinkedIn", "Indeed", "Naukri", "Glassdoor", "Wellfound", "Internshala"
-]
+# Search URL per platform. Fields: kw/loc are the URL-quoted title and
+# location, slug/loc_slug their lower-cased, hyphenated forms.
+_URL_TEMPLATES = {
+    "LinkedIn": "https://www.linkedin.com/jobs/search/?keywords={kw}&location={loc}",
+    "Indeed": "https://www.indeed.com/jobs?q={kw}&l={loc}",
+    "Naukri": "https://www.naukri.com/{slug}-jobs-in-{loc_slug}",
+    "Glassdoor": "https://www.glassdoor.co.in/Job/jobs.htm?sc.keyword={kw}&locT=C&locKeyword={loc}",
+    "Wellfound": "https://wellfound.com/role/r/{slug}",
+    "Internshala": "https://internshala.com/jobs/{slug}-jobs-in-{loc_slug}",
+}
+
+SUPPORTED_PLATFORMS = list(_URL_TEMPLATES)
+
+
+@lru_cache(maxsize=256)
+def _build_urls(job_title: str, location: str) -> tuple[tuple[str, str], ...]:
+    """Return (platform, url) pairs for a stripped title and location.
+
+    Cached because agents often repeat a search while refining one argument.
+    """
+    fields = {
+        "kw": _quote(job_title),
+        "loc": _quote(location),
+        "slug": job_title.lower().replace(" ", "-"),
+        "loc_slug": location.lower().replace(" ", "-"),
+    }
+    return tuple((name, template.format_map(fields)) for name, template in _URL_TEMPLATES.items())
 
 
 def search_jobs(job_title: str, location: str = "India") -> dict:
@@ -25,33 +50,8 @@ def search_jobs(job_title: str, location: str = "India") -> dict:
     job_title = job_title.strip()
     location = location.strip() if location else "India"
 
-    encode = urllib.parse.quote
-    slug = job_title.lower().replace(" ", "-")
-    location_slug = location.lower().replace(" ", "-")
-
-    urls = {
-        "LinkedIn": (
-            f"https://www.linkedin.com/jobs/search/"
-            f"?keywords={encode(job_title)}&location={encode(location)}"
-        ),
-        "Indeed": (
-            f"https://www.indeed.com/jobs"
-            f"?q={encode(job_title)}&l={encode(location)}"
-        ),
-        "Naukri": (
-            f"https://www.naukri.com/{slug}-jobs-in-{location_slug}"
-        ),
-        "Glassdoor": (
-            f"https://www.glassdoor.co.in/Job/jobs.htm"
-            f"?sc.keyword={encode(job_title)}&locT=C&locKeyword={encode(location)}"
-        ),
-        "Wellfound": (
-            f"https://wellfound.com/role/r/{slug}"
-        ),
-        "Internshala": (
-            f"https://internshala.com/jobs/{slug}-jobs-in-{location_slug}"
-        ),
-    }
+    # A fresh dict per call, so callers can't modify the cached URLs.
+    urls = dict(_build_urls(job_title, location))
 
     logger.info("Generated job search URLs for '%s' in '%s'", job_title, location)
     return urls
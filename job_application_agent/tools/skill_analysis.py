@@ -42,6 +42,58 @@ ROLE_REQUIREMENTS = {
     },
 }
 
+# Common shorthand and spellings for the roles above.
+ROLE_ALIASES = {
+    "frontend": "frontend developer",
+    "front-end": "frontend developer",
+    "front end": "frontend developer",
+    "front-end developer": "frontend developer",
+    "front end developer": "frontend developer",
+    "frontend engineer": "frontend developer",
+    "fe": "frontend developer",
+    "backend": "backend developer",
+    "back-end": "backend developer",
+    "back end": "backend developer",
+    "back-end developer": "backend developer",
+    "back end developer": "backend developer",
+    "backend engineer": "backend developer",
+    "be": "backend developer",
+    "full stack": "full stack developer",
+    "full-stack": "full stack developer",
+    "fullstack": "full stack developer",
+    "full-stack developer": "full stack developer",
+    "fullstack developer": "full stack developer",
+    "full stack engineer": "full stack developer",
+    "data science": "data scientist",
+    "ds": "data scientist",
+    "devops": "devops engineer",
+    "dev ops": "devops engineer",
+    "sre": "devops engineer",
+    "mobile": "mobile developer",
+    "mobile engineer": "mobile developer",
+    "android developer": "mobile developer",
+    "ios developer": "mobile developer",
+}
+
+_CATEGORIES = (
+    ("must_have", "Must Have (Critical)"),
+    ("good_to_have", "Good to Have (Competitive Edge)"),
+    ("bonus", "Bonus (Stand Out)"),
+)
+
+_HAVE_PREFIX = "  [HAVE] "
+_NEED_PREFIX = "  [NEED] "
+
+# Per role and category: (skill label, lowercased "X or Y" variants), built once
+# so analyze_skill_gap doesn't re-split and re-lower every label on each call.
+_ROLE_VARIANTS = {
+    role: {
+        category: [(skill, tuple(v.strip().lower() for v in skill.split(" or "))) for skill in skills]
+        for category, skills in requirements.items()
+    }
+    for role, requirements in ROLE_REQUIREMENTS.items()
+}
+
 
 def analyze_skill_gap(current_skills: str, target_role: str = "full stack developer") -> str:
     """Analyze the gap between current skills and target role requirements.
@@ -62,13 +114,18 @@ def analyze_skill_gap(current_skills: str, target_role: str = "full stack develo
         target_role = "full stack developer"
 
     target_role = target_role.strip().lower()
+    target_role = ROLE_ALIASES.get(target_role, target_role)
     user_skills = {s.strip().lower() for s in current_skills.split(",") if s.strip()}
 
     if not user_skills:
         return "Error: No valid skills found. Please provide skills separated by commas."
 
     # Find the closest matching role
-    requirements = ROLE_REQUIREMENTS.get(target_role, ROLE_REQUIREMENTS["default"])
+    requirements = _ROLE_VARIANTS.get(target_role, _ROLE_VARIANTS["default"])
+
+    # One NUL-separated haystack: a variant is in it exactly when it is a
+    # substring of some user skill, so each check is a single C-level scan.
+    haystack = "\0".join(user_skills)
 
     lines = [f"Skill Gap Analysis for: {target_role.title()}\n"]
     lines.append(f"Your skills: {', '.join(sorted(user_skills))}\n")
@@ -76,26 +133,20 @@ def analyze_skill_gap(current_skills: str, target_role: str = "full stack develo
     total_matched = 0
     total_required = 0
 
-    for category, label in [
-        ("must_have", "Must Have (Critical)"),
-        ("good_to_have", "Good to Have (Competitive Edge)"),
-        ("bonus", "Bonus (Stand Out)"),
-    ]:
+    for category, label in _CATEGORIES:
         skills = requirements[category]
         total_required += len(skills)
         lines.append(f"**{label}:**")
 
-        for skill in skills:
+        for skill, skill_variants in skills:
             # Check if user has any variant of the skill
-            skill_variants = [s.strip().lower() for s in skill.split(" or ")]
-            has_skill = any(
-                variant in user_skills or any(variant in us for us in user_skills)
-                for variant in skill_variants
+            # Exact names hit the set first; only the rest need the substring scan.
+            has_skill = any(variant in user_skills for variant in skill_variants) or any(
+                variant in haystack for variant in skill_variants
             )
-            icon = "[HAVE]" if has_skill else "[NEED]"
             if has_skill:
                 total_matched += 1
-            lines.append(f"  {icon} {skill}")
+            lines.append((_HAVE_PREFIX if has_skill else _NEED_PREFIX) + skill)
 
         lines.append("")
 
@@ -3,17 +3,49 @@ import json
 import logging
 import os
 import random
-from datetime import datetime
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
-MOOD_FILE = os.path.join(DATA_DIR, "mood_log.json")
-JOURNAL_FILE = os.path.join(DATA_DIR, "journal.json")
+# Private generator, so picks don't contend for the random module's shared state.
+_rng = random.Random()
+
+# Set LIFEPILOT_DATA_DIR to keep data files somewhere other than ./data.
+DATA_DIR = os.getenv("LIFEPILOT_DATA_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data"
+)
+MOOD_FILE = os.path.join(DATA_DIR, "mood_log.jsonl")
+JOURNAL_FILE = os.path.join(DATA_DIR, "journal.jsonl")
+LEGACY_MOOD_FILE = os.path.join(DATA_DIR, "mood_log.json")
+LEGACY_JOURNAL_FILE = os.path.join(DATA_DIR, "journal.json")
+
+# Pre-JSONL file each log is migrated from on first access.
+_LEGACY_FILES = {MOOD_FILE: LEGACY_MOOD_FILE, JOURNAL_FILE: LEGACY_JOURNAL_FILE}
 
 VALID_MOODS = ["great", "good", "okay", "low", "stressed", "anxious", "sad", "angry", "tired"]
+_VALID_MOOD_SET = frozenset(VALID_MOODS)
+
+POSITIVE_MOODS = frozenset({"great", "good"})
+NEGATIVE_MOODS = frozenset({"sad", "angry", "stressed", "anxious"})
 
-MOTIVATIONAL_QUOTES = [
+MOTIVATIONAL_QUOTES = (
     "The only way to do great work is to love what you do. - Steve Jobs",
     "It does not matter how slowly you go as long as you do not stop. - Confucius",
     "Believe you can and you're halfway there. - Theodore Roosevelt",
@@ -34,9 +66,9 @@ MOTIVATIONAL_QUOTES = [
     "You don't have to be perfect to be amazing.",
     "Discipline is choosing between what you want now and what you want most.",
     "Small progress is still progress.",
-]
+)
 
-AFFIRMATIONS = [
+AFFIRMATIONS = (
     "I am capable of achieving my goals.",
     "I deserve success and happiness.",
     "I am growing stronger every single day.",
@@ -47,7 +79,7 @@ AFFIRMATIONS = [
     "I trust the process and my journey.",
     "I am enough, just as I am right now.",
     "Today I choose joy and gratitude.",
-]
+)
 
 BREATHING_EXERCISES = {
     "4-7-8 Relaxing Breath": (
@@ -75,45 +107,53 @@ BREATHING_EXERCISES = {
     ),
 }
 
+_BREATHING_NAMES = tuple(BREATHING_EXERCISES)
+
+# Rendered once at import; the exercises never change at runtime.
+_BREATHING_TEXT = {
+    name: f"**{name}**\n\n{instructions}\nTake your time. There's no rush."
+    for name, instructions in BREATHING_EXERCISES.items()
+}
+
 STRESS_TIPS = {
-    "stressed": [
+    "stressed": (
         "Take a 10-minute walk outside - movement reduces cortisol",
         "Write down 3 things you're grateful for right now",
         "Break your biggest task into tiny steps and do just the first one",
         "Listen to your favorite song and take deep breaths",
         "Talk to someone you trust about what's on your mind",
-    ],
-    "anxious": [
+    ),
+    "anxious": (
         "Try the 4-7-8 breathing technique (ask me for instructions)",
         "Write down your worries - getting them out of your head helps",
         "Focus only on the next 30 minutes, not the whole day",
         "Limit caffeine and social media for the rest of today",
         "Remember: anxiety lies. You've handled hard things before.",
-    ],
-    "sad": [
+    ),
+    "sad": (
         "It's okay to feel sad. Don't fight it - acknowledge it",
         "Reach out to one person who makes you feel safe",
         "Do one small thing that usually brings you joy",
         "Go outside and get sunlight for at least 15 minutes",
         "Remember: bad days don't mean a bad life. This will pass.",
-    ],
-    "angry": [
+    ),
+    "angry": (
         "Step away from the situation for at least 10 minutes",
         "Write down exactly what made you angry without filtering",
         "Do intense physical exercise to channel the energy",
         "Ask yourself: will this matter in 5 years?",
         "Practice the box breathing technique to cool down",
-    ],
-    "tired": [
+    ),
+    "tired": (
         "Take a 20-minute power nap if possible (set an alarm!)",
         "Drink water - dehydration causes fatigue more than you'd think",
         "Step outside for fresh air and sunlight",
         "Prioritize only 1-2 essential tasks today - it's okay to rest",
         "Go to bed 1 hour earlier tonight. Sleep debt is real.",
-    ],
+    ),
 }
 
-JOURNAL_PROMPTS = [
+JOURNAL_PROMPTS = (
     "What's one thing you accomplished today that you're proud of?",
     "What's something you're looking forward to this week?",
     "Write about a challenge you faced recently and what you learned.",
@@ -124,28 +164,224 @@ JOURNAL_PROMPTS = [
     "What's something weighing on your mind? Write it all out.",
     "Who made a positive impact on your life recently?",
     "What would you do if you knew you couldn't fail?",
-]
+)
+
+
+# fsync whole-file writes before swapping them in. Set DATA_FSYNC=0 to trade durability for speed.
+DATA_FSYNC = os.getenv("DATA_FSYNC", "1") != "0"
+
+# Parsed file contents by path as (key, data), reused until the file's
+# (mtime_ns, size) key changes.
+_CACHE: dict[str, tuple[tuple[int, int], list]] = {}
+
+# Running aggregates per log as (key, stats), valid for the same file state as
+# the _CACHE entry with that key. See _load_stats.
+_STATS: dict[str, tuple[tuple[int, int], dict]] = {}
+
+# Open batch() blocks, and the encoded lines they have held back per path. A
+# held-back path's _CACHE entry already includes those entries.
+_BATCH_DEPTH = 0
+_PENDING: dict[str, list[bytes]] = {}
+
+# Cache key for held-back entries of a log that does not exist yet.
+_PENDING_KEY = (-1, -1)
 
 
 def _ensure_data_dir() -> None:
     os.makedirs(DATA_DIR, exist_ok=True)
 
 
-def _load_json(filepath: str) -> list:
+def _file_key(filepath: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _parse_lines(raw: bytes) -> list:
+    entries = []
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries.append(_loads(line))
+        except json.JSONDecodeError:
+            logger.warning("Skipping unreadable line in wellness log.")
+    return entries
+
+
+def _load_cached(filepath: str) -> list:
+    """Return a JSONL log's entries, parsing it only when it changed.
+
+    The result is shared with the cache: callers must not change it.
+    """
+    if filepath in _PENDING:
+        return _CACHE[filepath][1]
     _ensure_data_dir()
-    if not os.path.exists(filepath):
+    key = _file_key(filepath)
+    if key is None:
+        _CACHE.pop(filepath, None)
+        legacy = _LEGACY_FILES.get(filepath)
+        if legacy is not None and os.path.exists(legacy):
+            return _migrate_legacy(filepath, legacy)
         return []
+    cached = _CACHE.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1]
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        with open(filepath, "rb") as f:
+            data = _parse_lines(f.read())
+    except IOError:
         return []
+    _CACHE[filepath] = (key, data)
+    return data
+
+
+_entry_date = itemgetter("date")
+
+
+def _entries_since(filepath: str, cutoff: str) -> list:
+    """Return a log's entries dated on or after cutoff (YYYY-MM-DD).
+
+    Logs are appended in time order, so the cutoff is found by bisection.
+    """
+    entries = _load_cached(filepath)
+    return entries[bisect_left(entries, cutoff, key=_entry_date):]
+
 
+def _append_entry(filepath: str, entry: dict) -> None:
+    """Append one entry as a JSONL line, keeping the file's cache entry current.
 
-def _save_json(filepath: str, data: list) -> None:
+    Inside a batch() block the line is held back until the block exits.
+    """
+    if _BATCH_DEPTH:
+        if filepath not in _PENDING:
+            _load_cached(filepath)
+            if filepath not in _CACHE:
+                _CACHE[filepath] = (_PENDING_KEY, [])
+            _PENDING[filepath] = []
+        _PENDING[filepath].append(_dumps(entry) + b"\n")
+        _CACHE[filepath][1].append(entry)
+        return
     _ensure_data_dir()
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    previous_key = _file_key(filepath)
+    with open(filepath, "ab") as f:
+        f.write(_dumps(entry) + b"\n")
+    cached = _CACHE.get(filepath)
+    if previous_key is None:
+        _CACHE[filepath] = (_file_key(filepath), [entry])
+    elif cached is not None and cached[0] == previous_key:
+        cached[1].append(entry)
+        _CACHE[filepath] = (_file_key(filepath), cached[1])
+    else:
+        _CACHE.pop(filepath, None)
+
+
+@contextmanager
+def batch():
+    """Hold back mood and journal appends until the end of the block.
+
+    Each log written inside the block gets all its new lines in one write on
+    exit, which suits backfilling many entries. Blocks may nest; the
+    outermost one writes. If it exits with an exception, nothing held back
+    is written.
+    """
+    global _BATCH_DEPTH
+    _BATCH_DEPTH += 1
+    try:
+        yield
+    except BaseException:
+        _BATCH_DEPTH -= 1
+        if _BATCH_DEPTH == 0:
+            _drop_pending()
+        raise
+    _BATCH_DEPTH -= 1
+    if _BATCH_DEPTH == 0:
+        _flush()
+
+
+def _flush() -> None:
+    while _PENDING:
+        filepath, lines = _PENDING.popitem()
+        try:
+            _ensure_data_dir()
+            with open(filepath, "ab") as f:
+                f.write(b"".join(lines))
+        except BaseException:
+            _CACHE.pop(filepath, None)
+            _STATS.pop(filepath, None)
+            _drop_pending()
+            raise
+        # Re-read on next use, in case another writer appended since the load.
+        _CACHE.pop(filepath, None)
+        _STATS.pop(filepath, None)
+
+
+def _drop_pending() -> None:
+    while _PENDING:
+        filepath, _ = _PENDING.popitem()
+        _CACHE.pop(filepath, None)
+        _STATS.pop(filepath, None)
+
+
+def _migrate_legacy(filepath: str, legacy: str) -> list:
+    """Convert a pre-JSONL log (one JSON list) into a JSONL file."""
+    try:
+        with open(legacy, "rb") as f:
+            entries = _loads(f.read())
+    except (json.JSONDecodeError, IOError):
+        logger.warning("Could not read legacy file %s, starting fresh.", legacy)
+        return []
+    if not isinstance(entries, list):
+        return []
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(_dumps(entry) + b"\n" for entry in entries))
+        if DATA_FSYNC:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+    os.replace(legacy, legacy + ".bak")
+    _CACHE[filepath] = (_file_key(filepath), entries)
+    logger.info("Migrated %d entries to %s", len(entries), filepath)
+    return entries
+
+
+def _load_stats(filepath: str) -> dict:
+    """Return {"count", "words", "dates"} for a log: entries, total word_count, logged days.
+
+    Built once per file state; _append_record keeps it current on writes.
+    """
+    entries = _load_cached(filepath)
+    cached = _CACHE.get(filepath)
+    key = cached[0] if cached is not None else None
+    entry = _STATS.get(filepath)
+    if entry is not None and key is not None and entry[0] == key:
+        return entry[1]
+    stats = {
+        "count": len(entries),
+        "words": sum(e.get("word_count", 0) for e in entries),
+        "dates": {e["date"] for e in entries},
+    }
+    if key is not None:
+        _STATS[filepath] = (key, stats)
+    return stats
+
+
+def _append_record(filepath: str, record: dict) -> dict:
+    """Append a record to a log and return its updated stats."""
+    stats = _load_stats(filepath)
+    _append_entry(filepath, record)
+    stats["count"] += 1
+    stats["words"] += record.get("word_count", 0)
+    stats["dates"].add(record["date"])
+    cached = _CACHE.get(filepath)
+    if cached is not None:
+        _STATS[filepath] = (cached[0], stats)
+    else:
+        _STATS.pop(filepath, None)
+    return stats
 
 
 def log_mood(mood: str, notes: str = "") -> str:
@@ -163,18 +399,17 @@ def log_mood(mood: str, notes: str = "") -> str:
         return f"Please tell me how you're feeling. Options: {', '.join(VALID_MOODS)}"
 
     mood = mood.strip().lower()
-    if mood not in VALID_MOODS:
+    if mood not in _VALID_MOOD_SET:
         return f"I don't recognize '{mood}'. Try one of: {', '.join(VALID_MOODS)}"
 
-    entries = _load_json(MOOD_FILE)
+    timestamp = datetime.now().isoformat(sep=" ", timespec="minutes")
     entry = {
         "mood": mood,
         "notes": notes.strip() if notes else "",
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
-        "date": datetime.now().strftime("%Y-%m-%d"),
+        "timestamp": timestamp,
+        "date": timestamp[:10],
     }
-    entries.append(entry)
-    _save_json(MOOD_FILE, entries)
+    stats = _append_record(MOOD_FILE, entry)
 
     # Build response
     lines = [f"Mood logged: {mood} ({entry['timestamp']})"]
@@ -182,20 +417,18 @@ def log_mood(mood: str, notes: str = "") -> str:
     if mood in STRESS_TIPS:
         tips = STRESS_TIPS[mood]
         lines.append(f"\nI hear you. Here are some things that might help:\n")
-        for i, tip in enumerate(random.sample(tips, min(3, len(tips))), 1):
+        for i, tip in enumerate(_rng.sample(tips, 3), 1):
             lines.append(f"  {i}. {tip}")
 
     if mood in ("great", "good"):
         lines.append(f"\nThat's wonderful! Keep riding this energy.")
-        lines.append(f"Affirmation: {random.choice(AFFIRMATIONS)}")
+        lines.append(f"Affirmation: {_rng.choice(AFFIRMATIONS)}")
     elif mood == "okay":
         lines.append(f"\nOkay is fine. Not every day needs to be amazing.")
-        lines.append(f"Here's a thought: {random.choice(MOTIVATIONAL_QUOTES)}")
+        lines.append(f"Here's a thought: {_rng.choice(MOTIVATIONAL_QUOTES)}")
 
     # Show streak info
-    today = datetime.now().strftime("%Y-%m-%d")
-    dates_logged = sorted(set(e["date"] for e in entries))
-    lines.append(f"\nMood tracking streak: {len(dates_logged)} days logged total")
+    lines.append(f"\nMood tracking streak: {len(stats['dates'])} days logged total")
 
     logger.info("Logged mood: %s", mood)
     return "\n".join(lines)
@@ -210,16 +443,14 @@ def get_mood_history(days: int = 7) -> str:
     Returns:
         Formatted mood history with patterns and insights.
     """
-    entries = _load_json(MOOD_FILE)
-    if not entries:
+    if not _load_cached(MOOD_FILE):
         return "No mood entries yet. Use log_mood() to start tracking how you feel!"
 
     days = max(1, min(int(days), 90))
 
     # Filter to recent days
-    from datetime import timedelta
-    cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-    recent = [e for e in entries if e["date"] >= cutoff]
+    cutoff = (datetime.now().date() - timedelta(days=days)).isoformat()
+    recent = _entries_since(MOOD_FILE, cutoff)
 
     if not recent:
         return f"No mood entries in the last {days} days."
@@ -227,32 +458,31 @@ def get_mood_history(days: int = 7) -> str:
     lines = [f"Mood History (last {days} days):\n"]
 
     # Group by date
-    by_date = {}
+    by_date = defaultdict(list)
     for e in recent:
-        by_date.setdefault(e["date"], []).append(e)
+        by_date[e["date"]].append(e)
 
     for date in sorted(by_date.keys(), reverse=True):
-        day_entries = by_date[date]
-        moods = ", ".join(e["mood"] for e in day_entries)
-        notes = [e["notes"] for e in day_entries if e.get("notes")]
+        moods = []
+        notes = []
+        for e in by_date[date]:
+            moods.append(e["mood"])
+            if e.get("notes"):
+                notes.append(e["notes"])
         note_str = f" - {'; '.join(notes)}" if notes else ""
-        lines.append(f"  {date}: {moods}{note_str}")
+        lines.append(f"  {date}: {', '.join(moods)}{note_str}")
 
     # Mood distribution
-    mood_counts = {}
-    for e in recent:
-        mood_counts[e["mood"]] = mood_counts.get(e["mood"], 0) + 1
+    mood_counts = Counter(e["mood"] for e in recent)
 
     lines.append(f"\nMood breakdown:")
-    for mood, count in sorted(mood_counts.items(), key=lambda x: -x[1]):
+    for mood, count in mood_counts.most_common():
         bar = "#" * count
         lines.append(f"  {mood:10s} {bar} ({count})")
 
     # Insight
-    most_common = max(mood_counts, key=mood_counts.get)
-    positive = sum(mood_counts.get(m, 0) for m in ("great", "good"))
-    negative = sum(mood_counts.get(m, 0) for m in ("sad", "angry", "stressed", "anxious"))
-    total = len(recent)
+    positive = sum(c for m, c in mood_counts.items() if m in POSITIVE_MOODS)
+    negative = sum(c for m, c in mood_counts.items() if m in NEGATIVE_MOODS)
 
     if positive > negative:
         lines.append(f"\nOverall: You've been mostly positive! Keep it up.")
@@ -270,8 +500,8 @@ def get_motivation() -> str:
     Returns:
         A random motivational quote with an affirmation.
     """
-    quote = random.choice(MOTIVATIONAL_QUOTES)
-    affirmation = random.choice(AFFIRMATIONS)
+    quote = _rng.choice(MOTIVATIONAL_QUOTES)
+    affirmation = _rng.choice(AFFIRMATIONS)
 
     return (
         f"**Today's Motivation:**\n"
@@ -301,10 +531,9 @@ def get_breathing_exercise(exercise_type: str = "calm") -> str:
     elif exercise_type in ("ground", "anxiety", "panic"):
         name = "5-5-5 Grounding"
     else:
-        name = random.choice(list(BREATHING_EXERCISES.keys()))
+        name = _rng.choice(_BREATHING_NAMES)
 
-    instructions = BREATHING_EXERCISES[name]
-    return f"**{name}**\n\n{instructions}\nTake your time. There's no rush."
+    return _BREATHING_TEXT[name]
 
 
 def journal_entry(entry: str = "", get_prompt: bool = False) -> str:
@@ -318,7 +547,7 @@ def journal_entry(entry: str = "", get_prompt: bool = False) -> str:
         Confirmation of saved entry or a journaling prompt.
     """
     if get_prompt or not entry or not entry.strip():
-        prompt = random.choice(JOURNAL_PROMPTS)
+        prompt = _rng.choice(JOURNAL_PROMPTS)
         return (
             f"**Journal Prompt:**\n"
             f"{prompt}\n\n"
@@ -326,23 +555,20 @@ def journal_entry(entry: str = "", get_prompt: bool = False) -> str:
             f"Call journal_entry() with your text when ready."
         )
 
-    entries = _load_json(JOURNAL_FILE)
+    text = entry.strip()
+    timestamp = datetime.now().isoformat(sep=" ", timespec="minutes")
     journal = {
-        "entry": entry.strip(),
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
-        "date": datetime.now().strftime("%Y-%m-%d"),
-        "word_count": len(entry.strip().split()),
+        "entry": text,
+        "timestamp": timestamp,
+        "date": timestamp[:10],
+        "word_count": len(text.split()),
     }
-    entries.append(journal)
-    _save_json(JOURNAL_FILE, entries)
-
-    total = len(entries)
-    total_words = sum(e.get("word_count", 0) for e in entries)
+    stats = _append_record(JOURNAL_FILE, journal)
 
     return (
         f"Journal entry saved! ({journal['timestamp']})\n"
         f"Words: {journal['word_count']}\n"
-        f"Total entries: {total} | Total words written: {total_words}\n\n"
+        f"Total entries: {stats['count']} | Total words written: {stats['words']}\n\n"
         f"Writing is therapy. Great job taking time for yourself."
     )
 
@@ -354,35 +580,28 @@ def weekly_checkin() -> str:
         Weekly wellness summary with mood trends, journal activity,
         and personalized recommendations.
     """
-    from datetime import timedelta
-
-    cutoff = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-
-    # Mood data
-    moods = _load_json(MOOD_FILE)
-    recent_moods = [m for m in moods if m["date"] >= cutoff]
+    today = datetime.now().date()
+    cutoff = (today - timedelta(days=7)).isoformat()
 
-    # Journal data
-    journals = _load_json(JOURNAL_FILE)
-    recent_journals = [j for j in journals if j["date"] >= cutoff]
+    recent_moods = _entries_since(MOOD_FILE, cutoff)
+    recent_journals = _entries_since(JOURNAL_FILE, cutoff)
 
     lines = ["**Weekly Wellness Check-In**\n"]
-    lines.append(f"Period: {cutoff} to {datetime.now().strftime('%Y-%m-%d')}\n")
+    lines.append(f"Period: {cutoff} to {today.isoformat()}\n")
 
     # Mood summary
     if recent_moods:
-        mood_counts = {}
-        for m in recent_moods:
-            mood_counts[m["mood"]] = mood_counts.get(m["mood"], 0) + 1
+        mood_counts = Counter(m["mood"] for m in recent_moods)
+        ranked = mood_counts.most_common()
 
-        dominant = max(mood_counts, key=mood_counts.get)
+        dominant = ranked[0][0]
         lines.append(f"**Mood Summary:** {len(recent_moods)} entries logged")
-        for mood, count in sorted(mood_counts.items(), key=lambda x: -x[1]):
+        for mood, count in ranked:
             lines.append(f"  - {mood}: {count} times")
         lines.append(f"  Dominant mood: {dominant}")
 
-        positive = sum(mood_counts.get(m, 0) for m in ("great", "good"))
-        negative = sum(mood_counts.get(m, 0) for m in ("sad", "angry", "stressed", "anxious"))
+        positive = sum(c for m, c in mood_counts.items() if m in POSITIVE_MOODS)
+        negative = sum(c for m, c in mood_counts.items() if m in NEGATIVE_MOODS)
 
         if positive > negative:
             lines.append("  Trend: Positive week overall!")
@@ -406,7 +625,7 @@ def weekly_checkin() -> str:
 
     # Recommendations
     lines.append("**This Week's Recommendations:**")
-    lines.append(f"  1. {random.choice(MOTIVATIONAL_QUOTES)}")
+    lines.append(f"  1. {_rng.choice(MOTIVATIONAL_QUOTES)}")
     lines.append(f"  2. Try a breathing exercise when you feel overwhelmed")
     lines.append(f"  3. Write in your journal at least 3 times this week")
     lines.append(f"  4. Get outside for at least 20 minutes of sunlight daily")
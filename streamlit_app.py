@@ -1,9 +1,19 @@
 """Life Pilot - Streamlit Chat Frontend for ADK Agent."""
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
+import threading
+import time
 import uuid
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _loads = json.loads
+
 # --- Page Config ---
 st.set_page_config(
     page_title="Life Pilot - Your AI Life Assistant",
@@ -16,6 +26,41 @@ st.set_page_config(
 ADK_URL = "http://127.0.0.1:8000"
 APP_NAME = "job_application_agent"
 
+# Streamed replies are redrawn at most this often, or once this many new
+# characters have arrived, instead of on every SSE frame.
+RENDER_INTERVAL = 0.08
+RENDER_CHARS = 64
+
+# Sidebar buttons as (label, prompt), filled into two columns top to bottom.
+QUICK_ACTIONS = (
+    ("🔍 Job Search", "Search for software developer jobs in India"),
+    ("📊 DSA Plan", "Give me a 4 week DSA study plan"),
+    ("😊 Log Mood", "I want to log my mood"),
+    ("💰 Expenses", "Show my expense summary for this month"),
+    ("📝 Resume Tips", "Give me resume tips"),
+    ("🎯 Skill Gap", "Analyze my skills for full stack developer"),
+    ("✅ My Tasks", "Show my current tasks"),
+    ("💪 Motivate Me", "Give me some motivation"),
+)
+MORE_ACTIONS = (
+    ("🎤 Interview Prep", "Give me interview questions for Python backend developer"),
+    ("📓 Journal", "Give me a journal prompt"),
+    ("🫁 Breathing", "Guide me through a breathing exercise"),
+    ("💼 Applications", "Show my job applications"),
+    ("🏆 Weekly Report", "Give me my weekly progress report"),
+    ("🏦 Savings", "Show my savings goals"),
+)
+
+# Chat messages drawn on each rerun; older ones are shown on request.
+HISTORY_WINDOW = 20
+
+# Chat messages kept in the browser session. The ADK session keeps the full
+# conversation for the agent, so trimming only affects what can be scrolled back to.
+MAX_MESSAGES = 200
+
+# Stop reading a reply that grows past this many characters.
+MAX_RESPONSE_CHARS = 200_000
+
 # --- Custom CSS ---
 st.markdown("""
 <style>
@@ -76,33 +121,96 @@ if "session_id" not in st.session_state:
     st.session_state.session_id = None
 if "user_id" not in st.session_state:
     st.session_state.user_id = "streamlit_user"
+if "conversation_key" not in st.session_state:
+    # Per browser session; keys the ADK session cache so tabs don't share a conversation.
+    st.session_state.conversation_key = uuid.uuid4().hex
+
+
+@st.cache_resource
+def _adk_session() -> requests.Session:
+    """One pooled HTTP session, so every turn reuses a keep-alive connection to the ADK server."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource(ttl=3600, max_entries=1000, show_spinner=False)
+def get_or_create_adk_session(user_id: str, conversation_key: str) -> str:
+    """Return the ADK session id for one browser conversation, creating it on first use.
+
+    Cached for an hour per conversation_key, which lets the warm-up thread hand
+    its session to the script thread. Raises on failure, so a failed attempt is
+    never cached.
+    """
+    resp = _adk_session().post(
+        f"{ADK_URL}/apps/{APP_NAME}/users/{user_id}/sessions",
+        json={},
+        timeout=10,
+    )
+    resp.raise_for_status()
+    return resp.json()["id"]
 
 
 def create_session():
-    """Create a new ADK session."""
+    """Attach the browser session to the user's ADK session."""
     try:
-        resp = requests.post(
-            f"{ADK_URL}/apps/{APP_NAME}/users/{st.session_state.user_id}/sessions",
-            json={},
-            timeout=10,
+        st.session_state.session_id = get_or_create_adk_session(
+            st.session_state.user_id, st.session_state.conversation_key
         )
-        if resp.status_code == 200:
-            data = resp.json()
-            st.session_state.session_id = data["id"]
-            return True
-    except requests.ConnectionError:
+        return True
+    except (requests.RequestException, KeyError, ValueError):
         return False
-    return False
 
 
-def send_message(message: str) -> str:
-    """Send a message to the ADK agent and get the response."""
+def _warm_adk_session(user_id: str, conversation_key: str) -> None:
+    """Create the ADK session ahead of the first message (runs in a daemon thread).
+
+    Only fills the get_or_create_adk_session cache; session_state is left to the
+    script thread, whose create_session() then returns without a round-trip.
+    """
+    try:
+        get_or_create_adk_session(user_id, conversation_key)
+    except (requests.RequestException, KeyError, ValueError):
+        pass  # create_session() retries synchronously on the first message
+
+
+def add_message(role: str, content: str) -> None:
+    """Append a chat message, dropping the oldest beyond MAX_MESSAGES."""
+    messages = st.session_state.messages
+    messages.append({"role": role, "content": content})
+    if len(messages) > MAX_MESSAGES:
+        del messages[:-MAX_MESSAGES]
+
+
+def _is_final_event(data: dict) -> bool:
+    """Mirror ADK's Event.is_final_response() for an SSE event payload.
+
+    The agent's final reply is a complete (non-partial) event whose parts
+    carry no tool calls or tool results; nothing useful follows it.
+    """
+    if data.get("partial"):
+        return False
+    parts = (data.get("content") or {}).get("parts") or []
+    return bool(parts) and not any(
+        key in part
+        for part in parts
+        for key in ("functionCall", "functionResponse", "function_call", "function_response")
+    )
+
+
+def send_message(message: str, placeholder=None) -> str:
+    """Send a message to the ADK agent and get the response.
+
+    If a placeholder (st.empty()) is given, the reply is drawn into it as it streams.
+    """
     if not st.session_state.session_id:
         if not create_session():
             return "Could not connect to the ADK server. Make sure it's running with `adk web .`"
 
     try:
-        resp = requests.post(
+        with _adk_session().post(
             f"{ADK_URL}/run_sse",
             json={
                 "app_name": APP_NAME,
@@ -115,25 +223,46 @@ def send_message(message: str) -> str:
             },
             timeout=60,
             stream=True,
-        )
-
-        full_response = ""
-        for line in resp.iter_lines(decode_unicode=True):
-            if line and line.startswith("data: "):
-                try:
-                    data = json.loads(line[6:])
-                    if "error" in data:
-                        error_msg = data["error"]
-                        if "RateLimitError" in error_msg:
-                            return full_response + "\n\n*(Rate limit hit - wait 30s and try again)*" if full_response else "Rate limit reached. Please wait 30 seconds and try again."
-                        return f"Error: {error_msg}"
-                    if "content" in data and "parts" in data["content"]:
-                        for part in data["content"]["parts"]:
-                            if "text" in part:
-                                full_response = part["text"]
-                except json.JSONDecodeError:
-                    continue
-
+        ) as resp:
+            # Partial (streamed) events carry deltas and are appended; a complete
+            # event carries the whole text and replaces what came before.
+            chunks = []
+            size = 0
+            rendered_size = 0
+            last_render = time.monotonic()
+            for line in resp.iter_lines():
+                if line and line.startswith(b"data: "):
+                    try:
+                        data = _loads(line[6:])
+                        if "error" in data:
+                            error_msg = data["error"]
+                            if "RateLimitError" in error_msg:
+                                return "".join(chunks) + "\n\n*(Rate limit hit - wait 30s and try again)*" if chunks else "Rate limit reached. Please wait 30 seconds and try again."
+                            return f"Error: {error_msg}"
+                        if "content" in data and "parts" in data["content"]:
+                            texts = [part["text"] for part in data["content"]["parts"] if "text" in part]
+                            if texts:
+                                if data.get("partial"):
+                                    chunks.extend(texts)
+                                    size += sum(map(len, texts))
+                                else:
+                                    chunks = [texts[-1]]
+                                    size = len(texts[-1])
+                    except json.JSONDecodeError:
+                        continue
+                    if size > MAX_RESPONSE_CHARS:
+                        chunks = ["".join(chunks)[:MAX_RESPONSE_CHARS], "\n\n*(Response truncated)*"]
+                        break
+                    if size and _is_final_event(data):
+                        break
+                    if placeholder is not None and size != rendered_size:
+                        now = time.monotonic()
+                        if now - last_render > RENDER_INTERVAL or abs(size - rendered_size) > RENDER_CHARS:
+                            placeholder.markdown("".join(chunks))
+                            rendered_size = size
+                            last_render = now
+
+        full_response = "".join(chunks)
         return full_response if full_response else "No response received. Try again."
 
     except requests.ConnectionError:
@@ -142,6 +271,29 @@ def send_message(message: str) -> str:
         return "Request timed out. The server might be busy. Try again."
 
 
+def _queue_action(prompt: str) -> None:
+    st.session_state.quick_action = prompt
+
+
+def _action_buttons(actions) -> None:
+    """Draw action buttons in two columns; a click queues its prompt for this run."""
+    half = (len(actions) + 1) // 2
+    for col, column_actions in zip(st.columns(2), (actions[:half], actions[half:])):
+        with col:
+            for label, prompt in column_actions:
+                st.button(label, use_container_width=True, on_click=_queue_action, args=(prompt,))
+
+
+# Create the ADK session in the background while the page renders.
+if st.session_state.session_id is None and not st.session_state.get("warming"):
+    st.session_state.warming = True
+    threading.Thread(
+        target=_warm_adk_session,
+        args=(st.session_state.user_id, st.session_state.conversation_key),
+        daemon=True,
+    ).start()
+
+
 # --- Sidebar ---
 with st.sidebar:
     st.markdown("### 🚀 Life Pilot")
@@ -151,46 +303,13 @@ with st.sidebar:
     # Quick Actions
     st.markdown("#### ⚡ Quick Actions")
 
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("🔍 Job Search", use_container_width=True):
-            st.session_state.quick_action = "Search for software developer jobs in India"
-        if st.button("📊 DSA Plan", use_container_width=True):
-            st.session_state.quick_action = "Give me a 4 week DSA study plan"
-        if st.button("😊 Log Mood", use_container_width=True):
-            st.session_state.quick_action = "I want to log my mood"
-        if st.button("💰 Expenses", use_container_width=True):
-            st.session_state.quick_action = "Show my expense summary for this month"
-
-    with col2:
-        if st.button("📝 Resume Tips", use_container_width=True):
-            st.session_state.quick_action = "Give me resume tips"
-        if st.button("🎯 Skill Gap", use_container_width=True):
-            st.session_state.quick_action = "Analyze my skills for full stack developer"
-        if st.button("✅ My Tasks", use_container_width=True):
-            st.session_state.quick_action = "Show my current tasks"
-        if st.button("💪 Motivate Me", use_container_width=True):
-            st.session_state.quick_action = "Give me some motivation"
+    _action_buttons(QUICK_ACTIONS)
 
     st.divider()
 
     # More actions
     st.markdown("#### 📋 More")
-    col3, col4 = st.columns(2)
-    with col3:
-        if st.button("🎤 Interview Prep", use_container_width=True):
-            st.session_state.quick_action = "Give me interview questions for Python backend developer"
-        if st.button("📓 Journal", use_container_width=True):
-            st.session_state.quick_action = "Give me a journal prompt"
-        if st.button("🫁 Breathing", use_container_width=True):
-            st.session_state.quick_action = "Guide me through a breathing exercise"
-    with col4:
-        if st.button("💼 Applications", use_container_width=True):
-            st.session_state.quick_action = "Show my job applications"
-        if st.button("🏆 Weekly Report", use_container_width=True):
-            st.session_state.quick_action = "Give me my weekly progress report"
-        if st.button("🏦 Savings", use_container_width=True):
-            st.session_state.quick_action = "Show my savings goals"
+    _action_buttons(MORE_ACTIONS)
 
     st.divider()
 
@@ -198,6 +317,8 @@ with st.sidebar:
     if st.button("🔄 New Conversation", use_container_width=True):
         st.session_state.messages = []
         st.session_state.session_id = None
+        st.session_state.conversation_key = uuid.uuid4().hex
+        st.session_state.warming = False
         st.rerun()
 
     st.markdown("---")
@@ -213,7 +334,8 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Show welcome message if no messages
-if not st.session_state.messages:
+welcome_shown = not st.session_state.messages
+if welcome_shown:
     st.markdown("""
     **Hey there! I'm Life Pilot, your personal AI assistant.** Here's what I can help with:
 
@@ -229,7 +351,11 @@ if not st.session_state.messages:
     """)
 
 # Display chat history
-for msg in st.session_state.messages:
+history = st.session_state.messages
+hidden = len(history) - HISTORY_WINDOW
+if hidden > 0 and not st.toggle(f"Show {hidden} earlier messages", key="show_history"):
+    history = history[hidden:]
+for msg in history:
     with st.chat_message(msg["role"], avatar="🚀" if msg["role"] == "assistant" else "👤"):
         st.markdown(msg["content"])
 
@@ -238,28 +364,36 @@ if "quick_action" in st.session_state and st.session_state.quick_action:
     prompt = st.session_state.quick_action
     st.session_state.quick_action = None
 
-    st.session_state.messages.append({"role": "user", "content": prompt})
+    add_message("user", prompt)
     with st.chat_message("user", avatar="👤"):
         st.markdown(prompt)
 
     with st.chat_message("assistant", avatar="🚀"):
+        placeholder = st.empty()
         with st.spinner("Thinking..."):
-            response = send_message(prompt)
-        st.markdown(response)
+            response = send_message(prompt, placeholder)
+        placeholder.markdown(response)
 
-    st.session_state.messages.append({"role": "assistant", "content": response})
-    st.rerun()
+    add_message("assistant", response)
+    # The turn is already drawn inline; rerun only if the page above it is now
+    # stale (welcome panel still up, or the earlier-messages count moved).
+    if welcome_shown or len(st.session_state.messages) > HISTORY_WINDOW:
+        st.rerun()
 
 # Chat input
 if prompt := st.chat_input("Ask me anything - jobs, mood, tasks, finances..."):
-    st.session_state.messages.append({"role": "user", "content": prompt})
+    add_message("user", prompt)
     with st.chat_message("user", avatar="👤"):
         st.markdown(prompt)
 
     with st.chat_message("assistant", avatar="🚀"):
+        placeholder = st.empty()
         with st.spinner("Thinking..."):
-            response = send_message(prompt)
-        st.markdown(response)
+            response = send_message(prompt, placeholder)
+        placeholder.markdown(response)
 
-    st.session_state.messages.append({"role": "assistant", "content": response})
-    st.rerun()
+    add_message("assistant", response)
+    # The turn is already drawn inline; rerun only if the page above it is now
+    # stale (welcome panel still up, or the earlier-messages count moved).
+    if welcome_shown or len(st.session_state.messages) > HISTORY_WINDOW:
+        st.rerun()
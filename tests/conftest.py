@@ -0,0 +1,32 @@
+"""Shared test setup."""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# Point the tools at a throwaway data directory before any test module imports
+# them, so the suite never touches ./data and parallel workers (pytest -n) each
+# get their own files. Prefer a RAM-backed tmpfs where there is one, and skip
+# fsync unless a run asks for it: the tests check file contents, not durability.
+_RAM_DIR = "/dev/shm"
+TEST_DATA_DIR = tempfile.mkdtemp(
+    prefix="lifepilot-test-", dir=_RAM_DIR if os.path.isdir(_RAM_DIR) else None
+)
+os.environ["LIFEPILOT_DATA_DIR"] = TEST_DATA_DIR
+os.environ.setdefault("DATA_FSYNC", "0")
+
+
+@pytest.fixture(autouse=True)
+def clean_data_dir():
+    """Start every test with an empty data directory."""
+    with os.scandir(TEST_DATA_DIR) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.remove(entry.path)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_DATA_DIR, ignore_errors=True)
@@ -2,21 +2,28 @@
 import json
 import os
 import pytest
+from job_application_agent.tools import application_tracker
 from job_application_agent.tools.application_tracker import (
     add_application,
     update_application,
     list_applications,
     TRACKER_FILE,
+    LEGACY_TRACKER_FILE,
     DATA_DIR,
 )
-@pytest.fixture(autouse=True)
-def clean_tracker():
-    """Remove tracker file before and after each test."""
-    if os.path.exists(TRACKER_FILE):
-        os.remove(TRACKER_FILE)
-    yield
-    if os.path.exists(TRACKER_FILE):
-        os.remove(TRACKER_FILE)
+
+
+def _read_tracker_file() -> list[dict]:
+    with open(TRACKER_FILE, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _reload_applications() -> list[dict]:
+    """Drop the in-memory cache and re-read applications from disk."""
+    application_tracker._update_cache(None)
+    return application_tracker._load_applications()
+
+
 class TestAddApplication:
     def test_add_basic(self):
         result = add_application("Google", "Software Engineer")
@@ -38,6 +45,12 @@ class TestAddApplication:
         result = add_application("Google", "SWE", status="invalid")
         assert "Error" in result
 
+    def test_status_aliases_normalized(self):
+        result = add_application("Google", "SWE", status="  Phone Screen ")
+        assert "Status: screening" in result
+        result = add_application("Meta", "SWE", status="INTERVIEW")
+        assert "Status: interview" in result
+
     def test_empty_company(self):
         result = add_application("", "SWE")
         assert "Error" in result
@@ -49,8 +62,7 @@ class TestAddApplication:
     def test_persists_to_file(self):
         add_application("Google", "SWE")
         assert os.path.exists(TRACKER_FILE)
-        with open(TRACKER_FILE, "r") as f:
-            data = json.load(f)
+        data = _read_tracker_file()
         assert len(data) == 1
         assert data[0]["company"] == "Google"
 
@@ -62,6 +74,18 @@ class TestUpdateApplication:
         assert "interview" in result
         assert "applied" in result  # old status shown
 
+    def test_failed_append_leaves_cache_unchanged(self, monkeypatch):
+        add_application("Google", "SWE")
+
+        def failing_append(record):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(application_tracker, "_append_line", failing_append)
+        with pytest.raises(OSError):
+            update_application(1, "interview")
+        monkeypatch.undo()
+        assert application_tracker._load_applications()[0]["status"] == "applied"
+
     def test_update_nonexistent(self):
         result = update_application(999, "interview")
         assert "Error" in result
@@ -75,9 +99,30 @@ class TestUpdateApplication:
     def test_update_with_notes(self):
         add_application("Google", "SWE")
         update_application(1, "interview", notes="Phone screen scheduled")
-        with open(TRACKER_FILE, "r") as f:
-            data = json.load(f)
+        data = _reload_applications()
         assert data[0]["notes"] == "Phone screen scheduled"
+        assert data[0]["status"] == "interview"
+
+    def test_update_appends_instead_of_rewriting(self):
+        add_application("Google", "SWE")
+        add_application("Meta", "SWE")
+        update_application(1, "interview")
+        lines = _read_tracker_file()
+        assert len(lines) == 3
+        assert lines[0]["status"] == "applied"
+        assert lines[2] == {
+            "op": "update", "id": 1, "status": "interview",
+            "last_updated": lines[2]["last_updated"],
+        }
+
+    def test_compacts_when_updates_outnumber_applications(self):
+        add_application("Google", "SWE")
+        update_application(1, "screening")
+        update_application(1, "interview")
+        lines = _read_tracker_file()
+        assert len(lines) == 1
+        assert lines[0]["status"] == "interview"
+        assert _reload_applications()[0]["status"] == "interview"
 
 
 class TestListApplications:
@@ -108,3 +153,57 @@ class TestListApplications:
         add_application("Google", "SWE", status="applied")
         result = list_applications("offer")
         assert "No applications" in result
+
+    def test_reflects_same_size_update(self):
+        add_application("Google", "SWE", status="screening")
+        assert "SCREENING" in list_applications()
+        update_application(1, "interview")
+        result = list_applications()
+        assert "INTERVIEW" in result
+        assert "SCREENING" not in result
+
+    def test_groups_in_status_order(self):
+        add_application("Google", "SWE", status="offer")
+        add_application("Meta", "SWE", status="applied")
+        add_application("Stripe", "SWE", status="interview")
+        result = list_applications()
+        assert result.index("**APPLIED**") < result.index("**INTERVIEW**") < result.index("**OFFER**")
+
+    def test_sees_external_file_changes(self):
+        add_application("Google", "SWE")
+        list_applications()
+        external = {
+            "id": 2, "company": "Stripe", "role": "SWE", "status": "applied",
+            "notes": "", "applied_date": "2026-01-01", "last_updated": "2026-01-01 10:00",
+        }
+        with open(TRACKER_FILE, "a") as f:
+            f.write(json.dumps(external) + "\n")
+        result = list_applications()
+        assert "Stripe" in result
+        assert "2 total" in result
+
+    def test_lists_unknown_status_last(self):
+        add_application("Google", "SWE")
+        external = {
+            "id": 2, "company": "Stripe", "role": "SWE", "status": "ghosted",
+            "notes": "", "applied_date": "2026-01-01", "last_updated": "2026-01-01 10:00",
+        }
+        with open(TRACKER_FILE, "a") as f:
+            f.write(json.dumps(external) + "\n")
+        result = list_applications()
+        assert result.index("**APPLIED**") < result.index("**GHOSTED**")
+
+
+class TestLegacyMigration:
+    def test_migrates_json_file(self):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        legacy = [{
+            "id": 1, "company": "Google", "role": "SWE", "status": "applied",
+            "notes": "", "applied_date": "2026-01-01", "last_updated": "2026-01-01 10:00",
+        }]
+        with open(LEGACY_TRACKER_FILE, "w") as f:
+            json.dump(legacy, f)
+        result = add_application("Meta", "SWE")
+        assert "#2" in result
+        assert [a["company"] for a in _read_tracker_file()] == ["Google", "Meta"]
+        assert not os.path.exists(LEGACY_TRACKER_FILE)
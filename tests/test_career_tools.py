@@ -7,38 +7,30 @@ from job_application_agent.tools.career_tools import (
 )
 
 
+@pytest.fixture(scope="session")
+def resume_tips():
+    return get_resume_tips()
+
+
 class TestGetDsaRoadmap:
     def test_default_4_weeks(self):
         result = get_dsa_roadmap()
         assert "Week 1" in result
         assert "Week 4" in result
 
-    def test_custom_weeks(self):
-        result = get_dsa_roadmap(8)
-        assert "Week 1" in result
-        assert "Week 8" in result
-
-    def test_1_week_plan(self):
-        result = get_dsa_roadmap(1)
-        assert "Week 1" in result
-
-    def test_16_week_plan(self):
-        result = get_dsa_roadmap(16)
-        assert "Week 1" in result
-
-    def test_clamps_to_max_16(self):
-        result = get_dsa_roadmap(100)
-        # 15 topics available, so max 15 weeks even if more requested
-        assert "Week 15" in result
-        assert "Week 17" not in result
-
-    def test_clamps_to_min_1(self):
-        result = get_dsa_roadmap(0)
-        assert "Week 1" in result
-
-    def test_negative_weeks_clamps_to_1(self):
-        result = get_dsa_roadmap(-5)
+    @pytest.mark.parametrize("weeks,last_week", [
+        (8, 8),
+        (1, 1),
+        (16, 15),  # 15 topics available, so max 15 weeks even if more requested
+        (100, 15),
+        (0, 1),
+        (-5, 1),
+    ])
+    def test_week_count_is_clamped(self, weeks, last_week):
+        result = get_dsa_roadmap(weeks)
         assert "Week 1" in result
+        assert f"Week {last_week}" in result
+        assert f"Week {last_week + 1}" not in result
 
     def test_includes_practice_tip(self):
         result = get_dsa_roadmap()
@@ -48,6 +40,14 @@ class TestGetDsaRoadmap:
         result = get_dsa_roadmap()
         assert "problems" in result
 
+    def test_topics_spread_evenly(self):
+        for weeks in range(1, 16):
+            week_lines = [l for l in get_dsa_roadmap(weeks).splitlines() if l.startswith("Week")]
+            sizes = [len(l.split(": ", 1)[1].rsplit(" (~", 1)[0].split(", ")) for l in week_lines]
+            assert len(sizes) == weeks
+            assert sum(sizes) == 15
+            assert max(sizes) - min(sizes) <= 1
+
     def test_different_weeks_give_different_plans(self):
         plan_2 = get_dsa_roadmap(2)
         plan_8 = get_dsa_roadmap(8)
@@ -55,23 +55,23 @@ class TestGetDsaRoadmap:
 
 
 class TestGetResumeTips:
-    def test_returns_string(self):
-        result = get_resume_tips()
+    def test_returns_string(self, resume_tips):
+        result = resume_tips
         assert isinstance(result, str)
 
-    def test_has_categories(self):
-        result = get_resume_tips()
+    def test_has_categories(self, resume_tips):
+        result = resume_tips
         assert "Format" in result
         assert "Content" in result
         assert "Mistakes To Avoid" in result
 
-    def test_has_actionable_tips(self):
-        result = get_resume_tips()
+    def test_has_actionable_tips(self, resume_tips):
+        result = resume_tips
         assert "Quantify" in result
         assert "action verbs" in result
 
-    def test_not_empty(self):
-        result = get_resume_tips()
+    def test_not_empty(self, resume_tips):
+        result = resume_tips
         assert len(result) > 100
 
 
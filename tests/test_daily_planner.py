@@ -1,23 +1,24 @@
 """Tests for daily planner tool."""
+import json
 import os
 import pytest
+from job_application_agent.tools import daily_planner
 from job_application_agent.tools.daily_planner import (
     add_task, complete_task, list_tasks,
     track_habit, view_habits,
     set_weekly_goal, complete_goal, weekly_progress_report,
-    TODOS_FILE, HABITS_FILE, GOALS_FILE,
+    TODOS_FILE, LEGACY_TODOS_FILE, HABITS_FILE, GOALS_FILE, DATA_DIR,
 )
 
 
-@pytest.fixture(autouse=True)
-def clean_files():
-    for f in [TODOS_FILE, HABITS_FILE, GOALS_FILE]:
-        if os.path.exists(f):
-            os.remove(f)
-    yield
-    for f in [TODOS_FILE, HABITS_FILE, GOALS_FILE]:
-        if os.path.exists(f):
-            os.remove(f)
+def _write_todos(todos: list[dict]) -> None:
+    with open(TODOS_FILE, "w") as f:
+        f.writelines(json.dumps(t) + "\n" for t in todos)
+
+
+def _read_todos_file() -> list[dict]:
+    with open(TODOS_FILE) as f:
+        return [json.loads(line) for line in f if line.strip()]
 
 
 class TestAddTask:
@@ -34,6 +35,16 @@ class TestAddTask:
         result = add_task("Submit report", due_date="2026-03-01")
         assert "2026-03-01" in result
 
+    def test_id_follows_highest_existing(self):
+        _write_todos([
+            {"id": 1, "task": "A", "priority": "low", "status": "pending",
+             "due_date": "", "created": "2026-01-01 10:00", "completed_at": ""},
+            {"id": 5, "task": "B", "priority": "low", "status": "pending",
+             "due_date": "", "created": "2026-01-01 10:00", "completed_at": ""},
+        ])
+        result = add_task("C")
+        assert "#6" in result
+
     def test_empty_task(self):
         result = add_task("")
         assert "Error" in result
@@ -49,6 +60,18 @@ class TestCompleteTask:
         result = complete_task(1)
         assert "completed" in result.lower()
 
+    def test_failed_append_leaves_task_pending(self, monkeypatch):
+        add_task("Test task")
+
+        def failing_append(filepath, line, record=None):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(daily_planner, "_append_journal", failing_append)
+        with pytest.raises(OSError):
+            complete_task(1)
+        monkeypatch.undo()
+        assert "already" not in complete_task(1)
+
     def test_complete_nonexistent(self):
         result = complete_task(999)
         assert "not found" in result.lower()
@@ -59,6 +82,32 @@ class TestCompleteTask:
         result = complete_task(1)
         assert "already" in result.lower()
 
+    def test_appends_instead_of_rewriting(self):
+        add_task("A")
+        add_task("B")
+        complete_task(1)
+        lines = _read_todos_file()
+        assert [line.get("op") for line in lines] == [None, None, "complete"]
+        assert "[x] #1 A" in list_tasks(show_completed=True)
+
+    def test_compacts_once_most_tasks_have_events(self):
+        add_task("A")
+        complete_task(1)
+        lines = _read_todos_file()
+        assert len(lines) == 1
+        assert lines[0]["status"] == "completed"
+
+    def test_migrates_json_file(self):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(LEGACY_TODOS_FILE, "w") as f:
+            json.dump([{
+                "id": 1, "task": "Old", "priority": "low", "status": "pending",
+                "due_date": "", "created": "2026-01-01 10:00", "completed_at": "",
+            }], f)
+        assert "#2" in add_task("New")
+        assert [t["task"] for t in _read_todos_file()] == ["Old", "New"]
+        assert not os.path.exists(LEGACY_TODOS_FILE)
+
 
 class TestListTasks:
     def test_empty(self):
@@ -72,11 +121,23 @@ class TestListTasks:
         assert "Task A" in result
         assert "Task B" in result
 
+    def test_sees_external_file_changes(self):
+        add_task("Task A")
+        list_tasks()
+        _write_todos([{
+            "id": 1, "task": "Edited elsewhere", "priority": "low", "status": "pending",
+            "due_date": "", "created": "2026-01-01 10:00", "completed_at": "",
+        }])
+        result = list_tasks()
+        assert "Edited elsewhere" in result
+        assert "Task A" not in result
+
     def test_all_completed(self):
         add_task("Task A")
         complete_task(1)
         result = list_tasks()
-        assert "crushing it" in result.lower() or "completed" in result.lower()
+        low = result.lower()
+        assert "crushing it" in low or "completed" in low
 
 
 class TestTrackHabit:
@@ -93,6 +154,28 @@ class TestTrackHabit:
         result = track_habit("")
         assert "Error" in result
 
+    def test_streak_counts_consecutive_days_from_legacy_entries(self):
+        from datetime import date, timedelta
+        today = date.today()
+        day = lambda n: (today - timedelta(days=n)).isoformat()
+        with open(HABITS_FILE, "w") as f:
+            json.dump([{
+                "name": "reading", "created": day(5),
+                "entries": [
+                    {"date": day(1), "completed": True},
+                    {"date": day(4), "completed": True},
+                    {"date": day(2), "completed": True},
+                    {"date": day(3), "completed": False},
+                ],
+            }], f)
+        result = track_habit("reading")
+        assert "Current streak: 3 days" in result
+        with open(HABITS_FILE) as f:
+            habit = json.load(f)[0]
+        assert "entries" not in habit
+        assert habit["dates"] == [day(4), day(3), day(2), day(1), day(0)]
+        assert habit["completed"] == [True, False, True, True, True]
+
 
 class TestViewHabits:
     def test_empty(self):
@@ -106,6 +189,26 @@ class TestViewHabits:
         assert "exercise" in result
         assert "meditation" in result
 
+    def test_cached_streak_lapses_after_a_day(self):
+        with open(HABITS_FILE, "w") as f:
+            json.dump([{
+                "name": "reading", "created": "2020-01-01",
+                "entries": [{"date": "2020-01-01", "completed": True}],
+                "streak": 1, "last_update_date": "2020-01-01",
+            }], f)
+        result = view_habits()
+        assert "[ ] reading: 0 day streak" in result
+
+    def test_legacy_habit_without_cached_streak(self):
+        track_habit("exercise")
+        with open(HABITS_FILE) as f:
+            habits = json.load(f)
+        del habits[0]["streak"], habits[0]["last_update_date"]
+        with open(HABITS_FILE, "w") as f:
+            json.dump(habits, f)
+        result = view_habits()
+        assert "[x] exercise: 1 day streak" in result
+
 
 class TestWeeklyGoals:
     def test_set_goal(self):
@@ -122,10 +225,29 @@ class TestWeeklyGoals:
         result = complete_goal(1)
         assert "completed" in result.lower()
 
+    def test_failed_save_leaves_goal_open(self, monkeypatch):
+        set_weekly_goal("Test goal")
+
+        def failing_write(filepath, payload):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(daily_planner, "_write_atomic", failing_write)
+        with pytest.raises(OSError):
+            complete_goal(1)
+        monkeypatch.undo()
+        assert daily_planner._load_index(GOALS_FILE)[1]["status"] != "completed"
+
     def test_complete_nonexistent(self):
         result = complete_goal(999)
         assert "not found" in result.lower()
 
+    def test_save_replaces_file_without_leftovers(self):
+        set_weekly_goal("First")
+        set_weekly_goal("Second")
+        with open(GOALS_FILE) as f:
+            assert [g["goal"] for g in json.load(f)] == ["First", "Second"]
+        assert not os.path.exists(GOALS_FILE + ".tmp")
+
 
 class TestWeeklyProgressReport:
     def test_empty_report(self):
@@ -139,3 +261,28 @@ class TestWeeklyProgressReport:
         result = weekly_progress_report()
         assert "Tasks" in result
         assert "Goals" in result
+
+    def test_counts_only_this_weeks_records(self):
+        _write_todos([
+            {"id": 1, "task": "Old", "priority": "low", "status": "completed",
+             "due_date": "", "created": "2020-01-01 10:00", "completed_at": "2020-01-01 11:00"},
+        ])
+        add_task("New")
+        track_habit("reading")
+        with open(HABITS_FILE) as f:
+            habits = json.load(f)
+        habits[0]["dates"].insert(0, "2020-01-01")
+        habits[0]["completed"].insert(0, True)
+        with open(HABITS_FILE, "w") as f:
+            json.dump(habits, f)
+        result = weekly_progress_report()
+        assert "Total: 1 | Completed: 0 | Pending: 1" in result
+        assert "reading: 1/1 days this week" in result
+
+    def test_reflects_changes_after_earlier_report(self):
+        add_task("A")
+        assert "Total: 1 | Completed: 0" in weekly_progress_report()
+        complete_task(1)
+        assert "Total: 1 | Completed: 1" in weekly_progress_report()
+        set_weekly_goal("Ship it")
+        assert "Ship it" in weekly_progress_report()
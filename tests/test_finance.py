@@ -1,25 +1,15 @@
 """Tests for finance tool."""
+import json
 import os
 import pytest
 from job_application_agent.tools.finance import (
     add_expense, view_expenses, add_income,
     set_budget, set_savings_goal, add_to_savings, view_savings,
-    financial_summary,
+    financial_summary, batch, _add_expenses_bulk,
     EXPENSES_FILE, INCOME_FILE, BUDGET_FILE, SAVINGS_FILE,
 )
 
 
-@pytest.fixture(autouse=True)
-def clean_files():
-    for f in [EXPENSES_FILE, INCOME_FILE, BUDGET_FILE, SAVINGS_FILE]:
-        if os.path.exists(f):
-            os.remove(f)
-    yield
-    for f in [EXPENSES_FILE, INCOME_FILE, BUDGET_FILE, SAVINGS_FILE]:
-        if os.path.exists(f):
-            os.remove(f)
-
-
 class TestAddExpense:
     def test_add_basic(self):
         result = add_expense(500, "food", "lunch")
@@ -61,6 +51,29 @@ class TestViewExpenses:
         result = view_expenses("today")
         assert "100" in result
 
+    def test_week_excludes_older_expenses(self):
+        with open(EXPENSES_FILE, "w") as f:
+            json.dump([{
+                "id": 1, "amount": 999.0, "category": "rent", "description": "",
+                "date": "2020-01-01", "timestamp": "2020-01-01 10:00",
+            }], f)
+        add_expense(150, "food")
+        result = view_expenses("week")
+        assert "Rs.150.00 (1 transactions)" in result
+        assert "rent" not in result
+
+    def test_sees_external_file_changes(self):
+        add_expense(100, "food")
+        view_expenses("all")
+        with open(EXPENSES_FILE, "w") as f:
+            json.dump([{
+                "id": 1, "amount": 4321.0, "category": "rent", "description": "",
+                "date": "2020-01-01", "timestamp": "2020-01-01 10:00",
+            }], f)
+        result = view_expenses("all")
+        assert "4,321.00" in result
+        assert "food" not in result
+
 
 class TestAddIncome:
     def test_add_salary(self):
@@ -87,6 +100,27 @@ class TestSetBudget:
         assert "Food" in result
         assert "Transport" in result
 
+    def test_skips_malformed_category_items(self):
+        result = set_budget(30000, " Food : 8000.5 ,transport:abc,rent")
+        with open(BUDGET_FILE) as f:
+            assert json.load(f)["categories"] == {"food": 8000.5}
+        assert "Skipped" in result
+        assert "transport:abc, rent" in result
+
+    def test_multi_word_and_hyphenated_categories(self):
+        set_budget(30000, "food delivery:500, health-care:100, rent:1e4")
+        with open(BUDGET_FILE) as f:
+            assert json.load(f)["categories"] == {
+                "food delivery": 500, "health-care": 100, "rent": 10000,
+            }
+
+    @pytest.mark.parametrize("item", ["food:5000abc", "food:-50", "food:nan", "food:1:2", ":100"])
+    def test_rejects_malformed_amounts(self, item):
+        result = set_budget(30000, item)
+        with open(BUDGET_FILE) as f:
+            assert json.load(f)["categories"] == {}
+        assert item in result
+
     def test_invalid_amount(self):
         result = set_budget(-100)
         assert "Error" in result
@@ -97,6 +131,16 @@ class TestSetBudget:
         result = add_expense(50, "food")
         assert "WARNING" in result or "budget" in result.lower()
 
+    def test_identical_save_is_skipped(self):
+        set_budget(30000)
+        inode = os.stat(BUDGET_FILE).st_ino
+        set_budget(30000)
+        assert os.stat(BUDGET_FILE).st_ino == inode
+        set_budget(20000)
+        assert os.stat(BUDGET_FILE).st_ino != inode
+        assert not os.path.exists(BUDGET_FILE + ".tmp")
+        assert "20,000" in financial_summary()
+
 
 class TestSavingsGoal:
     def test_create_goal(self):
@@ -127,6 +171,19 @@ class TestSavingsGoal:
         result = add_to_savings(999, 1000)
         assert "not found" in result.lower()
 
+    def test_converts_list_file_on_save(self):
+        with open(SAVINGS_FILE, "w") as f:
+            json.dump([{
+                "id": 3, "name": "Bike", "target": 2000, "saved": 0,
+                "deadline": "", "deposits": [], "created": "2026-01-01",
+            }], f)
+        assert "50%" in add_to_savings(3, 1000)
+        assert "Goal #4" in set_savings_goal("Trip", 5000)
+        with open(SAVINGS_FILE) as f:
+            data = json.load(f)
+        assert data["next_id"] == 5
+        assert sorted(data["goals"]) == ["3", "4"]
+
 
 class TestViewSavings:
     def test_empty(self):
@@ -156,3 +213,68 @@ class TestFinancialSummary:
         assert "Income" in result
         assert "Expense" in result
         assert "50,000" in result or "50000" in result
+
+
+class TestBatch:
+    def test_writes_once_on_exit(self):
+        with batch():
+            add_expense(100, "food")
+            add_expense(50, "transport")
+            assert not os.path.exists(EXPENSES_FILE)
+            assert "150" in view_expenses("today")
+        with open(EXPENSES_FILE) as f:
+            assert [e["amount"] for e in json.load(f)] == [100, 50]
+        assert "150" in view_expenses("today")
+
+    def test_exception_discards_deferred_writes(self):
+        add_expense(100, "food")
+        with pytest.raises(RuntimeError):
+            with batch():
+                add_expense(50, "transport")
+                raise RuntimeError("import failed")
+        with open(EXPENSES_FILE) as f:
+            assert [e["amount"] for e in json.load(f)] == [100]
+        assert "150" not in view_expenses("today")
+        assert "Today's total: Rs.101" in add_expense(1, "other")
+
+    def test_failed_flush_discards_every_deferred_write(self, monkeypatch):
+        from job_application_agent.tools import finance
+
+        add_expense(100, "food")
+
+        def failing_write(filepath, data):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(finance, "_write_json", failing_write)
+        with pytest.raises(OSError):
+            with batch():
+                add_expense(50, "transport")
+                add_income(1000, "salary")
+        monkeypatch.undo()
+        assert not finance._DIRTY
+        with open(EXPENSES_FILE) as f:
+            assert [e["amount"] for e in json.load(f)] == [100]
+        assert not os.path.exists(INCOME_FILE)
+        assert "150" not in view_expenses("today")
+        assert "Today's total: Rs.101" in add_expense(1, "other")
+
+    def test_bulk_reports_rejected_rows(self):
+        result = _add_expenses_bulk([
+            {"amount": 200, "category": "food"},
+            {"amount": -5, "category": "food"},
+            {"amount": 300, "category": "rent", "description": "June"},
+        ])
+        assert "Logged 2 of 3" in result
+        assert "Row 2" in result
+        assert "501" in add_expense(1, "other")
+
+
+def test_save_recreates_removed_data_dir(tmp_path, monkeypatch):
+    from job_application_agent.tools import finance
+
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(finance, "DATA_DIR", str(data_dir))
+    monkeypatch.setattr(finance, "BUDGET_FILE", str(data_dir / "budget.json"))
+    monkeypatch.setattr(finance, "_DATA_DIR_READY", True)
+    set_budget(30000)
+    assert (data_dir / "budget.json").exists()
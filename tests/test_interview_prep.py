@@ -1,9 +1,16 @@
 """Tests for interview_prep tool."""
 import pytest
 from job_application_agent.tools.interview_prep import get_interview_questions
+
+
+@pytest.fixture(scope="session")
+def default_questions():
+    return get_interview_questions()
+
+
 class TestGetInterviewQuestions:
-    def test_default_params(self):
-        result = get_interview_questions()
+    def test_default_params(self, default_questions):
+        result = default_questions
         assert "Technical Questions" in result
         assert "Behavioral Questions" in result
     def test_python_questions(self):
@@ -11,10 +18,12 @@ class TestGetInterviewQuestions:
         assert "decorator" in result.lower() or "GIL" in result
     def test_javascript_questions(self):
         result = get_interview_questions(tech="javascript")
-        assert "closure" in result.lower() or "event loop" in result.lower()
+        low = result.lower()
+        assert "closure" in low or "event loop" in low
     def test_java_questions(self):
         result = get_interview_questions(tech="java")
-        assert "abstract" in result.lower() or "interface" in result.lower()
+        low = result.lower()
+        assert "abstract" in low or "interface" in low
     def test_unknown_tech_uses_default(self):
         result = get_interview_questions(tech="rust")
         assert "Technical Questions" in result
@@ -28,11 +37,11 @@ class TestGetInterviewQuestions:
     def test_junior_role_no_system_design(self):
         result = get_interview_questions(role="junior developer")
         assert "System Design" not in result
-    def test_includes_star_method(self):
-        result = get_interview_questions()
+    def test_includes_star_method(self, default_questions):
+        result = default_questions
         assert "STAR" in result
-    def test_includes_tips(self):
-        result = get_interview_questions()
+    def test_includes_tips(self, default_questions):
+        result = default_questions
         assert "Tips" in result
     def test_empty_role_uses_default(self):
         result = get_interview_questions(role="", tech="python")
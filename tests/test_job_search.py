@@ -4,14 +4,12 @@ from job_application_agent.tools.job_search import search_jobs
 
 
 class TestSearchJobs:
-    def test_returns_all_platforms(self):
+    @pytest.mark.parametrize("platform", [
+        "LinkedIn", "Indeed", "Naukri", "Glassdoor", "Wellfound", "Internshala",
+    ])
+    def test_returns_all_platforms(self, platform):
         result = search_jobs("Python Developer")
-        assert "LinkedIn" in result
-        assert "Indeed" in result
-        assert "Naukri" in result
-        assert "Glassdoor" in result
-        assert "Wellfound" in result
-        assert "Internshala" in result
+        assert platform in result
 
     def test_urls_contain_job_title(self):
         result = search_jobs("Data Scientist", "Bangalore")